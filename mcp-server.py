@@ -5,7 +5,6 @@ Make sure FreeCAD is running with the Taiyaki AI workbench active.
 """
 import os
 import sys
-import importlib.util
 import subprocess
 import logging
 
@@ -46,19 +45,17 @@ def main():
         logger.error(f"Error importing server module: {e}")
         logger.info("Trying alternative approach...")
         
-        # If that fails, try running the module directly
+        # If that fails, import the package from src/ through the normal import
+        # machinery so the compiled bytecode in __pycache__ is reused between runs
         server_path = os.path.join(current_dir, "src", "freecad_mcp", "server.py")
         if os.path.exists(server_path):
             logger.info(f"Found server.py at {server_path}")
             
-            # Load the module directly
-            spec = importlib.util.spec_from_file_location("server", server_path)
-            server = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(server)
+            from freecad_mcp.server import main as server_main
             
             # Run the main function
             logger.info("Starting server directly")
-            server.main()
+            server_main()
         else:
             logger.error(f"Server module not found at {server_path}")
             return 1
@@ -3,10 +3,15 @@ Advanced CAD Operations Framework for FreeCAD
 Provides feature-based modeling, parametric operations, and manufacturing-aware design tools.
 """
 
+import ast
+import copy
 import math
 import logging
-from typing import Dict, List, Tuple, Any, Optional, Union
-from dataclasses import dataclass
+import operator
+from collections import defaultdict, deque
+from typing import Callable, ClassVar, Dict, FrozenSet, List, Set, Tuple, Any, Optional, Union
+from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -40,30 +45,128 @@ class BooleanOperation(Enum):
     SUBTRACT = "subtract"
     INTERSECT = "intersect"
 
-@dataclass
+# Operators and functions allowed in parametric expressions
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_EXPRESSION_FUNCTIONS = {
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "round": round,
+    "sqrt": math.sqrt,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "radians": math.radians,
+    "degrees": math.degrees,
+    "floor": math.floor,
+    "ceil": math.ceil,
+}
+
+def _compile_node(node: ast.AST) -> Callable[[Dict[str, float]], float]:
+    """Compile a parsed arithmetic expression node into a closure over a variable mapping"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        value = node.value
+        return lambda variables: value
+    if isinstance(node, ast.Name):
+        name = node.id
+        def lookup(variables: Dict[str, float]) -> float:
+            try:
+                return variables[name]
+            except KeyError:
+                raise NameError(f"name '{name}' is not defined") from None
+        return lookup
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        op = _BINARY_OPERATORS[type(node.op)]
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        return lambda variables: op(left(variables), right(variables))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        op = _UNARY_OPERATORS[type(node.op)]
+        operand = _compile_node(node.operand)
+        return lambda variables: op(operand(variables))
+    if isinstance(node, ast.Call) and not node.keywords:
+        func = node.func
+        if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == "math":
+            func_name = func.attr
+        else:
+            func_name = func.id if isinstance(func, ast.Name) else None
+        if func_name in _EXPRESSION_FUNCTIONS:
+            function = _EXPRESSION_FUNCTIONS[func_name]
+            args = [_compile_node(arg) for arg in node.args]
+            return lambda variables: function(*[arg(variables) for arg in args])
+    raise ValueError(f"Unsupported expression syntax: {ast.unparse(node)}")
+
+@lru_cache(maxsize=1024)
+def _compile_expression(expression: str) -> Tuple[Callable[[Dict[str, float]], float], FrozenSet[str]]:
+    """Compile an expression once, returning its closure and the variable names it references"""
+    body = ast.parse(expression, mode="eval").body
+    
+    # Names used as function references are not variables
+    function_refs = set()
+    for node in ast.walk(body):
+        if isinstance(node, ast.Call):
+            func = node.func
+            function_refs.add(id(func.value if isinstance(func, ast.Attribute) else func))
+    var_names = frozenset(
+        node.id for node in ast.walk(body)
+        if isinstance(node, ast.Name) and id(node) not in function_refs
+    )
+    return _compile_node(body), var_names
+
+@dataclass(slots=True)
 class ParametricExpression:
     """Parametric expression for dimensions"""
     expression: str
     variables: Dict[str, float]
     
+    # Evaluated results, shared by all instances so that re-evaluating an
+    # unchanged expression skips evaluation; parsing is cached by _compile_expression
+    _value_cache: ClassVar[Dict[Tuple[str, Tuple[Tuple[str, float], ...]], float]] = {}
+    _VALUE_CACHE_SIZE: ClassVar[int] = 1024
+    
     def evaluate(self) -> float:
         """Evaluate the parametric expression"""
         try:
-            # Simple expression evaluator (in real implementation, use proper parser)
-            result = eval(self.expression, {"__builtins__": {}}, self.variables)
-            return float(result)
+            function, var_names = _compile_expression(self.expression)
+            
+            # Key results on the values of the variables the expression references
+            key = (self.expression, tuple(sorted(
+                (name, self.variables[name]) for name in var_names if name in self.variables
+            )))
+            result = self._value_cache.get(key)
+            if result is None:
+                result = float(function(self.variables))
+                if len(self._value_cache) >= self._VALUE_CACHE_SIZE:
+                    self._value_cache.clear()
+                self._value_cache[key] = result
+            return result
         except Exception as e:
             logger.error(f"Failed to evaluate expression '{self.expression}': {e}")
             return 0.0
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SketchConstraint:
     """Geometric constraint in a sketch"""
     constraint_type: str  # coincident, parallel, perpendicular, equal, distance, angle
-    elements: List[str]   # Referenced sketch elements
+    elements: Tuple[str, ...]   # Referenced sketch elements
     value: Optional[float] = None  # For dimensional constraints
     
-@dataclass
+    def __post_init__(self):
+        if not isinstance(self.elements, tuple):
+            object.__setattr__(self, "elements", tuple(self.elements))
+
+@dataclass(slots=True)
 class SketchElement:
     """Element in a parametric sketch"""
     element_type: str  # line, arc, circle, spline
@@ -75,7 +178,7 @@ class SketchElement:
         if self.constraints is None:
             self.constraints = []
 
-@dataclass
+@dataclass(slots=True)
 class ParametricSketch:
     """Parametric sketch with constraints and elements"""
     name: str
@@ -92,7 +195,13 @@ class ParametricSketch:
         if not self.variables:
             self.variables = {}
 
-@dataclass
+class ManufacturingFlag:
+    """Bit flags summarizing a feature's manufacturing notes"""
+    HIGH_ASPECT_RATIO = 1
+    HAS_WARNING = 2
+    HAS_RECOMMENDATION = 4
+
+@dataclass(slots=True)
 class CADFeature:
     """Parametric CAD feature"""
     name: str
@@ -102,13 +211,33 @@ class CADFeature:
     sketch_name: Optional[str] = None
     manufacturing_notes: Dict[str, Any] = None
     
+    # Summary of manufacturing_notes read by reports, filled in from the notes
+    _process_hint: str = field(default="general", init=False, repr=False, compare=False)
+    _aspect_ratio: float = field(default=0.0, init=False, repr=False, compare=False)
+    _mfg_flags: int = field(default=0, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if self.dependencies is None:
             self.dependencies = []
         if self.manufacturing_notes is None:
             self.manufacturing_notes = {}
+        self._summarize_notes()
+    
+    def _summarize_notes(self) -> None:
+        """Refresh the report summary after manufacturing_notes change"""
+        notes = self.manufacturing_notes
+        self._process_hint = notes.get("process_hint", "general")
+        self._aspect_ratio = float(notes.get("aspect_ratio", 0))
+        flags = 0
+        if self._aspect_ratio > 5:
+            flags |= ManufacturingFlag.HIGH_ASPECT_RATIO
+        if notes.get("warning"):
+            flags |= ManufacturingFlag.HAS_WARNING
+        if notes.get("recommendation"):
+            flags |= ManufacturingFlag.HAS_RECOMMENDATION
+        self._mfg_flags = flags
 
-@dataclass
+@dataclass(slots=True)
 class AssemblyConstraint:
     """Constraint between assembly components"""
     constraint_type: str  # mate, align, insert, tangent
@@ -119,7 +248,7 @@ class AssemblyConstraint:
     offset: float = 0.0
     angle: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class AssemblyComponent:
     """Component in an assembly"""
     name: str
@@ -141,6 +270,20 @@ class AdvancedCADOperations:
         self.assemblies: Dict[str, List[AssemblyComponent]] = {}
         self.global_variables: Dict[str, float] = {}
         self.feature_tree: List[str] = []  # Ordered list of feature names
+        self._tree_index: Dict[str, int] = {}  # Feature name -> position in feature_tree
+        self._applied_variables: Dict[str, float] = {}  # global_variables as of the last update
+        self._var_to_features: Dict[str, Set[str]] = {}  # Variable -> features whose expressions use it
+        self._expr_cache: Dict[str, ParametricExpression] = {}  # Expressions bound to global_variables
+        # Equal constraints are immutable, so this model's sketches share one instance of each
+        self._constraint_intern: Dict[SketchConstraint, SketchConstraint] = {}
+        
+        # Bumped by every mutation; export_feature_tree reuses its result while unchanged
+        self._version = 0
+        self._export_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
+        
+        # Features bucketed at creation so reports never rescan the whole model
+        self._features_by_type: Dict[FeatureType, Dict[str, CADFeature]] = defaultdict(dict)
+        self._high_aspect_holes: Dict[str, CADFeature] = {}
         
     def create_parametric_sketch(self, name: str, plane: str = "XY") -> ParametricSketch:
         """Create a new parametric sketch"""
@@ -154,6 +297,7 @@ class AdvancedCADOperations:
             )
             
             self.sketches[name] = sketch
+            self._version += 1
             logger.info(f"Created parametric sketch: {name} on {plane} plane")
             return sketch
             
@@ -165,11 +309,12 @@ class AdvancedCADOperations:
                        end: Tuple[float, float], name: str = None) -> bool:
         """Add a line to a parametric sketch"""
         try:
-            if sketch_name not in self.sketches:
+            sketch = self.sketches.get(sketch_name)
+            if sketch is None:
                 logger.error(f"Sketch {sketch_name} not found")
                 return False
             
-            element_name = name or f"Line_{len(self.sketches[sketch_name].elements)}"
+            element_name = name or f"Line_{len(sketch.elements)}"
             
             line_element = SketchElement(
                 element_type="line",
@@ -180,7 +325,8 @@ class AdvancedCADOperations:
                 }
             )
             
-            self.sketches[sketch_name].elements.append(line_element)
+            sketch.elements.append(line_element)
+            self._version += 1
             logger.info(f"Added line {element_name} to sketch {sketch_name}")
             return True
             
@@ -188,15 +334,46 @@ class AdvancedCADOperations:
             logger.error(f"Failed to add line to sketch {sketch_name}: {e}")
             return False
     
+    def add_sketch_polyline(self, sketch_name: str, points: List[Tuple[float, float]],
+                            names: Optional[List[str]] = None) -> bool:
+        """Add connected lines through a sequence of points to a parametric sketch"""
+        try:
+            sketch = self.sketches.get(sketch_name)
+            if sketch is None:
+                logger.error(f"Sketch {sketch_name} not found")
+                return False
+            
+            elements = sketch.elements
+            first_index = len(elements)
+            for i, (start, end) in enumerate(zip(points, points[1:])):
+                element_name = names[i] if names else f"Line_{first_index + i}"
+                elements.append(SketchElement(
+                    element_type="line",
+                    points=[start, end],
+                    parameters={
+                        "name": element_name,
+                        "length": math.dist(start, end)
+                    }
+                ))
+            
+            self._version += 1
+            logger.info(f"Added {len(elements) - first_index} lines to sketch {sketch_name}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to add polyline to sketch {sketch_name}: {e}")
+            return False
+    
     def add_sketch_circle(self, sketch_name: str, center: Tuple[float, float], 
                          radius: float, name: str = None) -> bool:
         """Add a circle to a parametric sketch"""
         try:
-            if sketch_name not in self.sketches:
+            sketch = self.sketches.get(sketch_name)
+            if sketch is None:
                 logger.error(f"Sketch {sketch_name} not found")
                 return False
             
-            element_name = name or f"Circle_{len(self.sketches[sketch_name].elements)}"
+            element_name = name or f"Circle_{len(sketch.elements)}"
             
             circle_element = SketchElement(
                 element_type="circle",
@@ -208,7 +385,8 @@ class AdvancedCADOperations:
                 }
             )
             
-            self.sketches[sketch_name].elements.append(circle_element)
+            sketch.elements.append(circle_element)
+            self._version += 1
             logger.info(f"Added circle {element_name} to sketch {sketch_name}")
             return True
             
@@ -219,11 +397,14 @@ class AdvancedCADOperations:
     def add_sketch_constraint(self, sketch_name: str, constraint: SketchConstraint) -> bool:
         """Add a geometric constraint to a sketch"""
         try:
-            if sketch_name not in self.sketches:
+            sketch = self.sketches.get(sketch_name)
+            if sketch is None:
                 logger.error(f"Sketch {sketch_name} not found")
                 return False
             
-            self.sketches[sketch_name].constraints.append(constraint)
+            constraint = self._constraint_intern.setdefault(constraint, constraint)
+            sketch.constraints.append(constraint)
+            self._version += 1
             logger.info(f"Added {constraint.constraint_type} constraint to sketch {sketch_name}")
             return True
             
@@ -240,11 +421,7 @@ class AdvancedCADOperations:
                 return False
             
             # Handle parametric length
-            if isinstance(length, str):
-                length_expr = ParametricExpression(length, self.global_variables)
-                actual_length = length_expr.evaluate()
-            else:
-                actual_length = length
+            actual_length, length_expr = self._resolve(length)
             
             feature = CADFeature(
                 name=name,
@@ -253,7 +430,7 @@ class AdvancedCADOperations:
                     "length": actual_length,
                     "direction": direction,
                     "symmetric": symmetric,
-                    "length_expression": length if isinstance(length, str) else None
+                    "length_expression": length_expr
                 },
                 dependencies=[],
                 sketch_name=sketch_name,
@@ -263,8 +440,7 @@ class AdvancedCADOperations:
                 }
             )
             
-            self.features[name] = feature
-            self.feature_tree.append(name)
+            self._add_feature(feature)
             logger.info(f"Created extrude feature: {name} from sketch {sketch_name}")
             return True
             
@@ -281,11 +457,7 @@ class AdvancedCADOperations:
                 return False
             
             # Handle parametric angle
-            if isinstance(angle, str):
-                angle_expr = ParametricExpression(angle, self.global_variables)
-                actual_angle = angle_expr.evaluate()
-            else:
-                actual_angle = angle
+            actual_angle, angle_expr = self._resolve(angle)
             
             feature = CADFeature(
                 name=name,
@@ -294,7 +466,7 @@ class AdvancedCADOperations:
                     "angle": actual_angle,
                     "axis_point": axis_point,
                     "axis_direction": axis_direction,
-                    "angle_expression": angle if isinstance(angle, str) else None
+                    "angle_expression": angle_expr
                 },
                 dependencies=[],
                 sketch_name=sketch_name,
@@ -304,8 +476,7 @@ class AdvancedCADOperations:
                 }
             )
             
-            self.features[name] = feature
-            self.feature_tree.append(name)
+            self._add_feature(feature)
             logger.info(f"Created revolve feature: {name} from sketch {sketch_name}")
             return True
             
@@ -317,11 +488,7 @@ class AdvancedCADOperations:
         """Create a fillet feature on specified edges"""
         try:
             # Handle parametric radius
-            if isinstance(radius, str):
-                radius_expr = ParametricExpression(radius, self.global_variables)
-                actual_radius = radius_expr.evaluate()
-            else:
-                actual_radius = radius
+            actual_radius, radius_expr = self._resolve(radius)
             
             feature = CADFeature(
                 name=name,
@@ -329,7 +496,7 @@ class AdvancedCADOperations:
                 parameters={
                     "radius": actual_radius,
                     "edges": edges,
-                    "radius_expression": radius if isinstance(radius, str) else None
+                    "radius_expression": radius_expr
                 },
                 dependencies=self._get_dependencies_for_edges(edges),
                 manufacturing_notes={
@@ -339,8 +506,7 @@ class AdvancedCADOperations:
                 }
             )
             
-            self.features[name] = feature
-            self.feature_tree.append(name)
+            self._add_feature(feature)
             logger.info(f"Created fillet feature: {name} with radius {actual_radius}")
             return True
             
@@ -354,28 +520,11 @@ class AdvancedCADOperations:
         """Create a parametric hole feature"""
         try:
             # Handle parametric dimensions
-            if isinstance(diameter, str):
-                dia_expr = ParametricExpression(diameter, self.global_variables)
-                actual_diameter = dia_expr.evaluate()
-            else:
-                actual_diameter = diameter
-                
-            if isinstance(depth, str):
-                depth_expr = ParametricExpression(depth, self.global_variables)
-                actual_depth = depth_expr.evaluate()
-            else:
-                actual_depth = depth
+            actual_diameter, diameter_expr = self._resolve(diameter)
+            actual_depth, depth_expr = self._resolve(depth)
             
             # Manufacturing recommendations based on hole type
-            manufacturing_notes = {
-                "process_hint": "drill_operation",
-                "aspect_ratio": actual_depth / actual_diameter,
-                "tolerance": "H7" if hole_type == "precision" else "H9"
-            }
-            
-            if manufacturing_notes["aspect_ratio"] > 5:
-                manufacturing_notes["warning"] = "high_aspect_ratio_hole"
-                manufacturing_notes["recommendation"] = "consider_stepped_drill"
+            manufacturing_notes = self._hole_manufacturing_notes(actual_depth / actual_diameter, hole_type)
             
             feature = CADFeature(
                 name=name,
@@ -385,15 +534,14 @@ class AdvancedCADOperations:
                     "diameter": actual_diameter,
                     "depth": actual_depth,
                     "hole_type": hole_type,
-                    "diameter_expression": diameter if isinstance(diameter, str) else None,
-                    "depth_expression": depth if isinstance(depth, str) else None
+                    "diameter_expression": diameter_expr,
+                    "depth_expression": depth_expr
                 },
                 dependencies=[],
                 manufacturing_notes=manufacturing_notes
             )
             
-            self.features[name] = feature
-            self.feature_tree.append(name)
+            self._add_feature(feature)
             logger.info(f"Created hole feature: {name} - ∅{actual_diameter} × {actual_depth}")
             return True
             
@@ -401,6 +549,42 @@ class AdvancedCADOperations:
             logger.error(f"Failed to create hole feature {name}: {e}")
             return False
     
+    def batch_create_holes(self, names: List[str], positions: List[Tuple[float, float, float]],
+                           diameters: List[float], depths: List[float],
+                           hole_type: str = "simple") -> bool:
+        """Create many non-parametric hole features in one call"""
+        try:
+            if not len(names) == len(positions) == len(diameters) == len(depths):
+                logger.error("Hole batch names, positions, diameters and depths must have equal lengths")
+                return False
+            
+            # All aspect ratios up front, so a bad diameter fails before any hole is added
+            aspect_ratios = list(map(operator.truediv, depths, diameters))
+            
+            for name, position, diameter, depth, aspect_ratio in zip(
+                    names, positions, diameters, depths, aspect_ratios):
+                self._add_feature(CADFeature(
+                    name=name,
+                    feature_type=FeatureType.HOLE,
+                    parameters={
+                        "position": position,
+                        "diameter": diameter,
+                        "depth": depth,
+                        "hole_type": hole_type,
+                        "diameter_expression": None,
+                        "depth_expression": None
+                    },
+                    dependencies=[],
+                    manufacturing_notes=self._hole_manufacturing_notes(aspect_ratio, hole_type)
+                ))
+            
+            logger.info(f"Created {len(names)} hole features")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to create hole batch: {e}")
+            return False
+    
     def create_pattern_feature(self, name: str, base_feature: str, pattern_type: PatternType,
                               parameters: Dict[str, Any]) -> bool:
         """Create a pattern feature"""
@@ -424,8 +608,7 @@ class AdvancedCADOperations:
                 }
             )
             
-            self.features[name] = feature
-            self.feature_tree.append(name)
+            self._add_feature(feature)
             logger.info(f"Created {pattern_type.value} pattern: {name} based on {base_feature}")
             return True
             
@@ -439,10 +622,10 @@ class AdvancedCADOperations:
         try:
             # Validate that all referenced features exist
             all_features = target_features + tool_features
-            for feature_name in all_features:
-                if feature_name not in self.features:
-                    logger.error(f"Feature {feature_name} not found")
-                    return False
+            missing = next((f for f in all_features if f not in self.features), None)
+            if missing is not None:
+                logger.error(f"Feature {missing} not found")
+                return False
             
             feature = CADFeature(
                 name=name,
@@ -459,8 +642,7 @@ class AdvancedCADOperations:
                 }
             )
             
-            self.features[name] = feature
-            self.feature_tree.append(name)
+            self._add_feature(feature)
             logger.info(f"Created boolean {operation.value} feature: {name}")
             return True
             
@@ -472,6 +654,7 @@ class AdvancedCADOperations:
         """Set a global parametric variable"""
         try:
             self.global_variables[name] = value
+            self._version += 1
             logger.info(f"Set global variable {name} = {value}")
             return True
             
@@ -488,26 +671,44 @@ class AdvancedCADOperations:
         }
         
         try:
+            # Only features whose expressions use a changed variable need re-evaluating,
+            # plus everything downstream of them. Comparing against the values the last
+            # update applied also catches direct edits to global_variables
+            variables = self.global_variables
+            applied = self._applied_variables
+            dirty = set()
+            for var_name in variables.keys() | applied.keys():
+                if variables.get(var_name) != applied.get(var_name):
+                    dirty.update(self._var_to_features.get(var_name, ()))
+            
             # Update features in dependency order
             for feature_name in self.feature_tree:
                 feature = self.features[feature_name]
+                if feature_name not in dirty:
+                    if not any(dep in dirty for dep in feature.dependencies):
+                        continue
+                    dirty.add(feature_name)
                 
                 try:
                     # Update parametric expressions
                     updated_params = {}
                     for param_name, param_value in feature.parameters.items():
                         if param_name.endswith("_expression") and param_value:
-                            expr = ParametricExpression(param_value, self.global_variables)
                             base_param = param_name.replace("_expression", "")
-                            updated_params[base_param] = expr.evaluate()
+                            updated_params[base_param] = self._resolve(param_value)[0]
                     
                     # Update feature parameters
                     feature.parameters.update(updated_params)
+                    if feature.feature_type is FeatureType.HOLE:
+                        self._refresh_hole_notes(feature)
                     results["updated_features"].append(feature_name)
                     
                 except Exception as e:
                     results["errors"].append(f"Failed to update feature {feature_name}: {e}")
             
+            self._applied_variables = dict(variables)
+            if results["updated_features"]:
+                self._version += 1
             logger.info(f"Parametric model update complete: {len(results['updated_features'])} features updated")
             
         except Exception as e:
@@ -526,58 +727,46 @@ class AdvancedCADOperations:
         }
         
         try:
-            # Build dependency graph
+            dependency_graph = analysis["dependency_graph"]
+            in_degree: Dict[str, int] = {}
+            reverse_adj: Dict[str, List[str]] = {name: [] for name in self.features}
+            
+            # Build dependency graph, in-degree map and reverse adjacency in one pass
             for feature_name, feature in self.features.items():
-                analysis["dependency_graph"][feature_name] = feature.dependencies
+                dependency_graph[feature_name] = feature.dependencies
+                known_dependencies = 0
+                for dep in feature.dependencies:
+                    if dep in reverse_adj:
+                        reverse_adj[dep].append(feature_name)
+                        known_dependencies += 1
+                in_degree[feature_name] = known_dependencies
             
-            # Check for circular references using DFS
-            def has_circular_ref(node, visited, rec_stack):
-                visited.add(node)
-                rec_stack.add(node)
-                
-                for neighbor in analysis["dependency_graph"].get(node, []):
-                    if neighbor not in visited:
-                        if has_circular_ref(neighbor, visited, rec_stack):
-                            return True
-                    elif neighbor in rec_stack:
-                        return True
-                
-                rec_stack.remove(node)
-                return False
+            # Topological sort (Kahn's algorithm). Features whose in-degree never
+            # drops to zero are part of, or downstream of, a circular reference.
+            # A feature is only dequeued once all of its dependencies have been, so
+            # its dependency depth can be computed right there without recursion
+            depth = analysis["dependency_depth"]
+            remaining = dict(in_degree)
+            queue = deque(name for name, degree in remaining.items() if degree == 0)
+            while queue:
+                node = queue.popleft()
+                depth[node] = 1 + max(
+                    (depth.get(dep, 0) for dep in dependency_graph[node]), default=-1
+                )
+                for dependent in reverse_adj[node]:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        queue.append(dependent)
             
-            visited = set()
-            for feature_name in self.features:
-                if feature_name not in visited:
-                    if has_circular_ref(feature_name, visited, set()):
-                        analysis["circular_references"].append(feature_name)
+            analysis["circular_references"] = [
+                name for name, degree in remaining.items() if degree > 0
+            ]
             
             # Find orphaned features (no dependencies and not depended upon)
-            all_dependencies = set()
-            for deps in analysis["dependency_graph"].values():
-                all_dependencies.update(deps)
-            
-            for feature_name in self.features:
-                if (not analysis["dependency_graph"].get(feature_name, []) and 
-                    feature_name not in all_dependencies):
-                    analysis["orphaned_features"].append(feature_name)
-            
-            # Calculate dependency depth
-            def calculate_depth(node, memo):
-                if node in memo:
-                    return memo[node]
-                
-                dependencies = analysis["dependency_graph"].get(node, [])
-                if not dependencies:
-                    memo[node] = 0
-                    return 0
-                
-                max_depth = max(calculate_depth(dep, memo) for dep in dependencies)
-                memo[node] = max_depth + 1
-                return memo[node]
-            
-            depth_memo = {}
-            for feature_name in self.features:
-                analysis["dependency_depth"][feature_name] = calculate_depth(feature_name, depth_memo)
+            analysis["orphaned_features"] = [
+                name for name, dependents in reverse_adj.items()
+                if not dependents and not dependency_graph[name]
+            ]
             
             logger.info(f"Feature dependency analysis complete")
             
@@ -590,73 +779,174 @@ class AdvancedCADOperations:
     def generate_manufacturing_report(self) -> str:
         """Generate manufacturing analysis report for all features"""
         try:
-            report = "# Manufacturing Analysis Report\n\n"
+            parts: List[str] = ["# Manufacturing Analysis Report\n\n"]
+            
+            # Enum members bound once; members are singletons, so compare by identity
+            hole_type = FeatureType.HOLE
+            fillet_type = FeatureType.FILLET
+            pattern_type = FeatureType.PATTERN
+            
+            high_aspect_ratio = ManufacturingFlag.HIGH_ASPECT_RATIO
+            has_warning = ManufacturingFlag.HAS_WARNING
+            has_recommendation = ManufacturingFlag.HAS_RECOMMENDATION
             
             # Group features by manufacturing process
-            process_groups = {}
+            process_groups: Dict[str, List[str]] = defaultdict(list)
             for feature_name, feature in self.features.items():
-                process_hint = feature.manufacturing_notes.get("process_hint", "general")
-                if process_hint not in process_groups:
-                    process_groups[process_hint] = []
-                process_groups[process_hint].append(feature_name)
-            
-            report += "## Process Groups\n"
-            for process, features in process_groups.items():
-                report += f"### {process.replace('_', ' ').title()}\n"
-                for feature_name in features:
-                    feature = self.features[feature_name]
-                    report += f"- **{feature_name}** ({feature.feature_type.value})\n"
-                    
-                    # Add manufacturing-specific details
-                    if feature.feature_type == FeatureType.HOLE:
-                        diameter = feature.parameters.get("diameter", 0)
-                        depth = feature.parameters.get("depth", 0)
-                        aspect_ratio = feature.manufacturing_notes.get("aspect_ratio", 0)
-                        report += f"  - Diameter: {diameter:.2f}mm, Depth: {depth:.2f}mm\n"
-                        report += f"  - Aspect ratio: {aspect_ratio:.2f}\n"
-                        
-                        if aspect_ratio > 5:
-                            report += "  - ⚠️ High aspect ratio - consider stepped drilling\n"
-                    
-                    elif feature.feature_type == FeatureType.FILLET:
-                        radius = feature.parameters.get("radius", 0)
-                        report += f"  - Radius: {radius:.2f}mm\n"
-                        report += "  - Improves stress concentration\n"
-                    
-                    # Add warnings from manufacturing notes
-                    warning = feature.manufacturing_notes.get("warning")
-                    if warning:
-                        report += f"  - ⚠️ {warning.replace('_', ' ').title()}\n"
+                flags = feature._mfg_flags
+                lines = process_groups[feature._process_hint]
+                lines.append(f"- **{feature_name}** ({feature.feature_type.value})\n")
+                
+                # Add manufacturing-specific details
+                if feature.feature_type is hole_type:
+                    diameter = feature.parameters.get("diameter", 0)
+                    depth = feature.parameters.get("depth", 0)
+                    lines.append(f"  - Diameter: {diameter:.2f}mm, Depth: {depth:.2f}mm\n")
+                    lines.append(f"  - Aspect ratio: {feature._aspect_ratio:.2f}\n")
                     
-                    recommendation = feature.manufacturing_notes.get("recommendation")
-                    if recommendation:
-                        report += f"  - 💡 {recommendation.replace('_', ' ').title()}\n"
+                    if flags & high_aspect_ratio:
+                        lines.append("  - ⚠️ High aspect ratio - consider stepped drilling\n")
                 
-                report += "\n"
+                elif feature.feature_type is fillet_type:
+                    radius = feature.parameters.get("radius", 0)
+                    lines.append(f"  - Radius: {radius:.2f}mm\n")
+                    lines.append("  - Improves stress concentration\n")
+                
+                # Add warnings from manufacturing notes
+                if flags & has_warning:
+                    warning = feature.manufacturing_notes["warning"]
+                    lines.append(f"  - ⚠️ {warning.replace('_', ' ').title()}\n")
+                
+                if flags & has_recommendation:
+                    recommendation = feature.manufacturing_notes["recommendation"]
+                    lines.append(f"  - 💡 {recommendation.replace('_', ' ').title()}\n")
+            
+            parts.append("## Process Groups\n")
+            for process, lines in process_groups.items():
+                parts.append(f"### {process.replace('_', ' ').title()}\n")
+                parts.extend(lines)
+                parts.append("\n")
             
-            # Add general recommendations
-            report += "## General Recommendations\n"
+            # Add general recommendations, counted from the creation-time buckets
+            parts.append("## General Recommendations\n")
+            high_aspect_hole_count = len(self._high_aspect_holes)
+            fillet_count = len(self._features_by_type[fillet_type])
+            pattern_count = len(self._features_by_type[pattern_type])
             
-            hole_features = [f for f in self.features.values() if f.feature_type == FeatureType.HOLE]
-            if hole_features:
-                high_aspect_holes = [f for f in hole_features if f.manufacturing_notes.get("aspect_ratio", 0) > 5]
-                if high_aspect_holes:
-                    report += f"- Consider stepped drilling for {len(high_aspect_holes)} high aspect ratio holes\n"
+            if high_aspect_hole_count:
+                parts.append(f"- Consider stepped drilling for {high_aspect_hole_count} high aspect ratio holes\n")
             
-            fillet_features = [f for f in self.features.values() if f.feature_type == FeatureType.FILLET]
-            if fillet_features:
-                report += f"- {len(fillet_features)} fillet features will improve part durability\n"
+            if fillet_count:
+                parts.append(f"- {fillet_count} fillet features will improve part durability\n")
             
-            pattern_features = [f for f in self.features.values() if f.feature_type == FeatureType.PATTERN]
-            if pattern_features:
-                report += f"- {len(pattern_features)} pattern features enable batch processing efficiency\n"
+            if pattern_count:
+                parts.append(f"- {pattern_count} pattern features enable batch processing efficiency\n")
             
-            return report
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Failed to generate manufacturing report: {e}")
             return f"Error generating manufacturing report: {e}"
     
+    @staticmethod
+    def _hole_manufacturing_notes(aspect_ratio: float, hole_type: str) -> Dict[str, Any]:
+        """Manufacturing recommendations for a hole from its aspect ratio and type"""
+        manufacturing_notes = {
+            "process_hint": "drill_operation",
+            "aspect_ratio": aspect_ratio,
+            "tolerance": "H7" if hole_type == "precision" else "H9"
+        }
+        
+        if aspect_ratio > 5:
+            manufacturing_notes["warning"] = "high_aspect_ratio_hole"
+            manufacturing_notes["recommendation"] = "consider_stepped_drill"
+        
+        return manufacturing_notes
+    
+    def _refresh_hole_notes(self, feature: CADFeature) -> None:
+        """Rebuild a hole's manufacturing notes and summary from its current parameters"""
+        params = feature.parameters
+        feature.manufacturing_notes = self._hole_manufacturing_notes(
+            params["depth"] / params["diameter"], params["hole_type"]
+        )
+        feature._summarize_notes()
+        if feature._mfg_flags & ManufacturingFlag.HIGH_ASPECT_RATIO:
+            self._high_aspect_holes[feature.name] = feature
+        else:
+            self._high_aspect_holes.pop(feature.name, None)
+    
+    def _resolve(self, value: Union[float, str]) -> Tuple[float, Optional[str]]:
+        """Resolve a numeric or parametric value to (actual_value, expression_or_None)"""
+        if not isinstance(value, str):
+            return value, None
+        
+        expr = self._expr_cache.get(value)
+        if expr is None:
+            expr = ParametricExpression(value, self.global_variables)
+            self._expr_cache[value] = expr
+        return expr.evaluate(), value
+    
+    def _add_feature(self, feature: CADFeature) -> None:
+        """Register a feature in the model and index the variables its expressions use"""
+        name = feature.name
+        previous = self.features.get(name)
+        self.features[name] = feature
+        self._version += 1
+        
+        # feature_tree stays topologically ordered: new features only depend on
+        # existing ones, so appending is enough; a re-created feature keeps its slot
+        # unless it now depends on something that comes after it
+        position = self._tree_index.get(name)
+        if position is None:
+            self._tree_index[name] = len(self.feature_tree)
+            self.feature_tree.append(name)
+        elif any(self._tree_index.get(dep, -1) > position for dep in feature.dependencies):
+            self._reorder_feature_tree()
+        
+        # A re-created feature may change type, so drop it from its old bucket first
+        if previous is not None:
+            self._features_by_type[previous.feature_type].pop(name, None)
+            self._high_aspect_holes.pop(name, None)
+        self._features_by_type[feature.feature_type][name] = feature
+        if (feature.feature_type is FeatureType.HOLE
+                and feature._mfg_flags & ManufacturingFlag.HIGH_ASPECT_RATIO):
+            self._high_aspect_holes[name] = feature
+        
+        for param_name, param_value in feature.parameters.items():
+            if param_name.endswith("_expression") and param_value:
+                try:
+                    var_names = _compile_expression(param_value)[1]
+                except (SyntaxError, ValueError):
+                    continue
+                for var_name in var_names:
+                    self._var_to_features.setdefault(var_name, set()).add(name)
+    
+    def _reorder_feature_tree(self) -> None:
+        """Stable re-sort of feature_tree so every feature follows its dependencies"""
+        # Visited marks live in a byte vector indexed by current tree position
+        tree_index = self._tree_index
+        visited = bytearray(len(self.feature_tree))
+        ordered: List[str] = []
+        for root_position, root in enumerate(self.feature_tree):
+            if visited[root_position]:
+                continue
+            visited[root_position] = 1
+            stack = [(root, iter(self.features[root].dependencies))]
+            while stack:
+                node, deps = stack[-1]
+                for dep in deps:
+                    dep_position = tree_index.get(dep)
+                    if dep_position is not None and not visited[dep_position]:
+                        visited[dep_position] = 1
+                        stack.append((dep, iter(self.features[dep].dependencies)))
+                        break
+                else:
+                    stack.pop()
+                    ordered.append(node)
+        
+        self.feature_tree[:] = ordered
+        self._tree_index = {name: i for i, name in enumerate(ordered)}
+    
     def _get_dependencies_for_edges(self, edges: List[str]) -> List[str]:
         """Get feature dependencies for edge references"""
         # In a real implementation, this would parse edge references
@@ -664,15 +954,19 @@ class AdvancedCADOperations:
         dependencies = []
         for edge in edges:
             # Simple parsing: assume format "FeatureName.Edge1"
-            if "." in edge:
-                feature_name = edge.split(".")[0]
-                if feature_name in self.features:
-                    dependencies.append(feature_name)
+            feature_name, separator, _ = edge.partition(".")
+            if separator and feature_name in self.features:
+                dependencies.append(feature_name)
         return dependencies
     
     def export_feature_tree(self) -> Dict[str, Any]:
-        """Export the complete feature tree structure"""
-        return {
+        """Export the complete feature tree structure (cached until the model changes)"""
+        # global_variables can be edited directly, so its values are part of the key
+        key = (self._version, tuple(self.global_variables.items()))
+        if self._export_cache is not None and self._export_cache[0] == key:
+            return copy.deepcopy(self._export_cache[1])
+        
+        export = {
             "sketches": {name: {
                 "plane": sketch.plane,
                 "elements": len(sketch.elements),
@@ -691,6 +985,9 @@ class AdvancedCADOperations:
             "global_variables": self.global_variables,
             "feature_order": self.feature_tree
         }
+        # The cache holds a snapshot detached from the model, and every caller gets its own copy
+        self._export_cache = (key, copy.deepcopy(export))
+        return copy.deepcopy(self._export_cache[1])
 
 # Utility functions for common CAD operations
 
@@ -703,11 +1000,12 @@ def create_rectangular_sketch(cad_ops: AdvancedCADOperations, name: str,
         x, y = center
         w, h = width / 2, height / 2
         
-        # Add rectangle lines
-        cad_ops.add_sketch_line(name, (x - w, y - h), (x + w, y - h), "bottom")
-        cad_ops.add_sketch_line(name, (x + w, y - h), (x + w, y + h), "right")
-        cad_ops.add_sketch_line(name, (x + w, y + h), (x - w, y + h), "top")
-        cad_ops.add_sketch_line(name, (x - w, y + h), (x - w, y - h), "left")
+        # Add rectangle lines as one closed polyline
+        cad_ops.add_sketch_polyline(
+            name,
+            [(x - w, y - h), (x + w, y - h), (x + w, y + h), (x - w, y + h), (x - w, y - h)],
+            ["bottom", "right", "top", "left"]
+        )
         
         # Add constraints
         cad_ops.add_sketch_constraint(name, SketchConstraint("parallel", ["bottom", "top"]))
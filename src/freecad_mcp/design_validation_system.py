@@ -3,11 +3,18 @@ Design Validation System for FreeCAD
 Comprehensive validation framework for geometry, manufacturing, structural, assembly, and cost analysis.
 """
 
+import json
 import math
+import hashlib
 import logging
-from typing import Dict, List, Tuple, Any, Optional, Union
-from dataclasses import dataclass
-from enum import Enum
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache, partial
+from operator import mul
+from typing import Callable, Dict, Iterator, List, NamedTuple, Tuple, Any, Optional, Union
+from dataclasses import dataclass, field, fields, replace
+from enum import Enum, IntEnum
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -29,7 +36,31 @@ class ValidationCategory(Enum):
     COMPLIANCE = "compliance"
     SUSTAINABILITY = "sustainability"
 
-@dataclass
+# Members in definition order, built once instead of iterating the enum class per call
+_SEVERITIES = tuple(ValidationSeverity)
+_CATEGORIES = tuple(ValidationCategory)
+
+# Definition-order position of each member, so counts can live in plain lists
+_SEVERITY_IDX = {member: idx for idx, member in enumerate(_SEVERITIES)}
+_CATEGORY_IDX = {member: idx for idx, member in enumerate(_CATEGORIES)}
+
+# Report headings, so reports do not re-case the values
+_SEVERITY_LABELS = {member: member.value.upper() for member in _SEVERITIES}
+_CATEGORY_LABELS = {member: member.value.title() for member in _CATEGORIES}
+
+# Enum members bound once at module level for the issue-building hot paths
+_GEOM, _MFG, _STRUCT, _ASM, _COST = (
+    ValidationCategory.GEOMETRY, ValidationCategory.MANUFACTURING, ValidationCategory.STRUCTURAL,
+    ValidationCategory.ASSEMBLY, ValidationCategory.COST
+)
+_INFO, _WARN, _ERR, _CRIT = (
+    ValidationSeverity.INFO, ValidationSeverity.WARNING, ValidationSeverity.ERROR, ValidationSeverity.CRITICAL
+)
+
+# Most severe first, the order reports list issues in
+_SEVERITY_ORDER = (_CRIT, _ERR, _WARN, _INFO)
+
+@dataclass(slots=True)
 class ValidationIssue:
     """Individual validation issue"""
     category: ValidationCategory
@@ -43,7 +74,11 @@ class ValidationIssue:
     time_impact: Optional[float] = None
     compliance_standard: Optional[str] = None
     
-@dataclass
+def _copy_issues(issues: List[ValidationIssue]) -> List[ValidationIssue]:
+    """Independent copies of issues, so cached results cannot be changed through a caller"""
+    return [replace(issue, affected_objects=list(issue.affected_objects)) for issue in issues]
+
+@dataclass(slots=True)
 class ValidationRule:
     """Validation rule definition"""
     name: str
@@ -53,7 +88,7 @@ class ValidationRule:
     parameters: Dict[str, Any]
     enabled: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Complete validation result"""
     timestamp: datetime
@@ -65,6 +100,198 @@ class ValidationResult:
     recommendations: List[str]
     estimated_cost_impact: float
     estimated_time_impact: float
+    category_totals: Optional[List[int]] = None  # issues_by_category indexed by category idx
+    severity_totals: Optional[List[int]] = None  # issues_by_severity indexed by severity idx
+    
+    def __post_init__(self):
+        """Derive the idx-indexed totals for results built from the dicts alone"""
+        if self.severity_totals is None:
+            self.severity_totals = [self.issues_by_severity.get(s.value, 0) for s in _SEVERITIES]
+        if self.category_totals is None:
+            self.category_totals = [self.issues_by_category.get(c.value, 0) for c in _CATEGORIES]
+
+@dataclass(slots=True)
+class IssueTable:
+    """Issues alongside column copies of the fields the summary reductions read
+    
+    Severity and category idx take one byte per issue so they can be counted with
+    bytearray.count; impacts are doubles, 0.0 for issues that have none.
+    """
+    issues: List[ValidationIssue] = field(default_factory=list)
+    severity_idx: bytearray = field(default_factory=bytearray)
+    category_idx: bytearray = field(default_factory=bytearray)
+    cost_impact: array = field(default_factory=lambda: array("d"))
+    time_impact: array = field(default_factory=lambda: array("d"))
+    
+    def extend(self, issues: List[ValidationIssue]) -> None:
+        """Append a batch of issues and their column values"""
+        self.issues.extend(issues)
+        self.severity_idx.extend([_SEVERITY_IDX[issue.severity] for issue in issues])
+        self.category_idx.extend([_CATEGORY_IDX[issue.category] for issue in issues])
+        self.cost_impact.extend([issue.cost_impact or 0.0 for issue in issues])
+        self.time_impact.extend([issue.time_impact or 0.0 for issue in issues])
+
+@dataclass(slots=True)
+class GeometryArrays:
+    """Column-oriented copy of the face, feature and hole data of a set of objects
+    
+    Each row carries the index of its object in ``names``, so checks can screen a
+    whole design with one pass over a numeric column and only look up the object
+    for the rows that produce an issue.
+    """
+    names: List[str] = field(default_factory=list)
+    face_owner: array = field(default_factory=lambda: array("l"))
+    face_thickness: array = field(default_factory=lambda: array("d"))
+    face_center: List[Any] = field(default_factory=list)
+    feature_owner: array = field(default_factory=lambda: array("l"))
+    feature_type: List[Any] = field(default_factory=list)
+    feature_size: array = field(default_factory=lambda: array("d"))
+    feature_location: List[Any] = field(default_factory=list)
+    hole_owner: array = field(default_factory=lambda: array("l"))
+    hole_diameter: array = field(default_factory=lambda: array("d"))
+    hole_depth: array = field(default_factory=lambda: array("d"))
+    hole_position: List[Any] = field(default_factory=list)
+    
+    @classmethod
+    def from_objects(cls, objects: Dict[str, Any]) -> "GeometryArrays":
+        """Flatten the faces, features and holes of every object into columns"""
+        arrays = cls()
+        for obj_name, obj_data in objects.items():
+            arrays.add_object(obj_name, obj_data)
+        return arrays
+    
+    def add_object(self, obj_name: str, obj_data: Dict[str, Any]) -> None:
+        """Append the rows of one object
+        
+        Faces, features and holes are flattened independently. A row whose numeric
+        fields are not numbers is skipped with a warning, so one malformed entry only
+        drops itself rather than failing every geometry check.
+        """
+        obj_idx = len(self.names)
+        self.names.append(obj_name)
+        
+        for face in _geometry_rows(obj_data, "faces"):
+            try:
+                thickness = float(face.get("thickness", 0))
+            except (TypeError, ValueError, AttributeError):
+                logger.warning(f"Skipping malformed face of {obj_name}: {face!r}")
+                continue
+            self.face_owner.append(obj_idx)
+            self.face_thickness.append(thickness)
+            self.face_center.append(face.get("center"))
+        
+        for feature in _geometry_rows(obj_data, "features"):
+            try:
+                size = float(feature.get("size", 0))
+            except (TypeError, ValueError, AttributeError):
+                logger.warning(f"Skipping malformed feature of {obj_name}: {feature!r}")
+                continue
+            self.feature_owner.append(obj_idx)
+            self.feature_type.append(feature.get("type"))
+            self.feature_size.append(size)
+            self.feature_location.append(feature.get("location"))
+        
+        for hole in _geometry_rows(obj_data, "holes"):
+            try:
+                diameter = float(hole.get("diameter", 0))
+                depth = float(hole.get("depth", 0))
+            except (TypeError, ValueError, AttributeError):
+                logger.warning(f"Skipping malformed hole of {obj_name}: {hole!r}")
+                continue
+            self.hole_owner.append(obj_idx)
+            self.hole_diameter.append(diameter)
+            self.hole_depth.append(depth)
+            self.hole_position.append(hole.get("position"))
+
+def _geometry_rows(obj_data: Any, key: str) -> List[Any]:
+    """The face, feature or hole list of an object; empty when the object or list is malformed"""
+    try:
+        rows = obj_data.get(key, [])
+    except AttributeError:
+        return []
+    return rows if isinstance(rows, (list, tuple)) else []
+
+def _as_geometry_arrays(objects: Union[Dict[str, Any], GeometryArrays]) -> GeometryArrays:
+    """Accept either prebuilt columns or the plain objects dict"""
+    if isinstance(objects, GeometryArrays):
+        return objects
+    return GeometryArrays.from_objects(objects)
+
+# Severities indexed by rank; "warning, raised to error past a limit" is _SEVERITY_BY_RANK[1 + past_limit]
+_SEVERITY_BY_RANK = (_INFO, _WARN, _ERR, _CRIT)
+
+# Issue constructors with the per-check constant fields already bound
+_WALL_THICKNESS_ISSUE = partial(
+    ValidationIssue,
+    category=_GEOM,
+    title="Insufficient Wall Thickness",
+    cost_impact=0.1,  # Relative cost increase
+    time_impact=2.0   # Hours to fix
+)
+_FEATURE_SIZE_ISSUE = partial(
+    ValidationIssue,
+    category=_GEOM,
+    title="Feature Too Small",
+    cost_impact=0.05,
+    time_impact=1.0
+)
+_HIGH_ASPECT_HOLE_ISSUE = partial(
+    ValidationIssue,
+    category=_GEOM,
+    severity=_WARN,
+    title="High Aspect Ratio Hole",
+    recommendation="Consider stepped drilling or reduce depth",
+    cost_impact=0.15,
+    time_impact=1.5
+)
+_SMALL_HOLE_ISSUE = partial(
+    ValidationIssue,
+    category=_GEOM,
+    severity=_WARN,
+    title="Small Hole Diameter",
+    recommendation="Consider increasing diameter or using specialized tooling",
+    cost_impact=0.08,
+    time_impact=0.5
+)
+
+# Message templates with the threshold already formatted in, built once per threshold value
+
+@lru_cache(maxsize=None)
+def _wall_thickness_messages(min_wall_thickness: float) -> Tuple[str, str]:
+    """Description template and recommendation for a wall thickness limit"""
+    return ("Wall thickness {:.2f}mm is below minimum %.2fmm" % min_wall_thickness,
+            "Increase wall thickness to at least %.2fmm" % min_wall_thickness)
+
+@lru_cache(maxsize=None)
+def _feature_size_messages(min_feature_size: float) -> Tuple[str, str]:
+    """Description and recommendation templates for a feature size limit"""
+    return ("{} feature size {:.2f}mm is below minimum %.2fmm" % min_feature_size,
+            "Increase {} size to at least %.2fmm" % min_feature_size)
+
+@lru_cache(maxsize=None)
+def _corner_radius_messages(min_corner_radius: float) -> Tuple[str, str]:
+    """Description template and recommendation for a CNC corner radius limit"""
+    return ("Internal corner radius {:.2f}mm is below minimum %.2fmm for CNC" % min_corner_radius,
+            "Add fillet with radius ≥ %.2fmm" % min_corner_radius)
+
+@lru_cache(maxsize=None)
+def _draft_angle_messages(min_draft_angle: float) -> Tuple[str, str]:
+    """Description template and recommendation for a molding draft angle limit"""
+    return ("Draft angle {:.2f}° is below minimum %.2f° for injection molding" % min_draft_angle,
+            "Add draft angle ≥ %.2f°" % min_draft_angle)
+
+# Per-hole classification flags produced by _screen_holes
+HOLE_HIGH_ASPECT = 1
+HOLE_SMALL_DIAMETER = 2
+
+def _screen_holes(diameter: array, depth: array, max_aspect_ratio: float, min_diameter: float) -> bytearray:
+    """Classify every hole in one numeric pass; zero means the hole is fine"""
+    flags = bytearray(len(diameter))
+    for i, (d, h) in enumerate(zip(diameter, depth)):
+        if d > 0 and h > 0:
+            flags[i] = ((HOLE_HIGH_ASPECT if h / d > max_aspect_ratio else 0)
+                        | (HOLE_SMALL_DIAMETER if d < min_diameter else 0))
+    return flags
 
 class GeometryValidator:
     """Validates geometric properties and integrity"""
@@ -75,140 +302,405 @@ class GeometryValidator:
         self.max_aspect_ratio = 20.0
         self.min_angle = 0.5           # degrees
         
-    def validate_wall_thickness(self, objects: Dict[str, Any]) -> List[ValidationIssue]:
+    def validate_wall_thickness(self, objects: Union[Dict[str, Any], GeometryArrays]) -> List[ValidationIssue]:
         """Validate minimum wall thickness"""
         issues = []
         
         try:
-            for obj_name, obj_data in objects.items():
-                # Mock wall thickness analysis
-                faces = obj_data.get("faces", [])
+            # Mock wall thickness analysis, screened over the flattened face column
+            arrays = _as_geometry_arrays(objects)
+            description, recommendation = _wall_thickness_messages(self.min_wall_thickness)
+            face_thickness = arrays.face_thickness
+            flagged = self._flag_thin_walls(arrays)
+            
+            # One issue per flagged face, so the list is sized once and filled in place
+            issues = [None] * len(flagged)
+            for k, i in enumerate(flagged):
+                thickness = face_thickness[i]
                 
-                for face_idx, face in enumerate(faces):
-                    thickness = face.get("thickness", 0)
-                    
-                    if thickness > 0 and thickness < self.min_wall_thickness:
-                        severity = ValidationSeverity.ERROR if thickness < 0.3 else ValidationSeverity.WARNING
-                        
-                        issues.append(ValidationIssue(
-                            category=ValidationCategory.GEOMETRY,
-                            severity=severity,
-                            title="Insufficient Wall Thickness",
-                            description=f"Wall thickness {thickness:.2f}mm is below minimum {self.min_wall_thickness:.2f}mm",
-                            affected_objects=[obj_name],
-                            location=face.get("center"),
-                            recommendation=f"Increase wall thickness to at least {self.min_wall_thickness:.2f}mm",
-                            cost_impact=0.1,  # Relative cost increase
-                            time_impact=2.0   # Hours to fix
-                        ))
+                issues[k] = _WALL_THICKNESS_ISSUE(
+                    severity=_SEVERITY_BY_RANK[1 + (thickness < 0.3)],
+                    description=description.format(thickness),
+                    affected_objects=[arrays.names[arrays.face_owner[i]]],
+                    location=arrays.face_center[i],
+                    recommendation=recommendation
+                )
                         
         except Exception as e:
             logger.error(f"Wall thickness validation failed: {e}")
+            issues = [issue for issue in issues if issue is not None]
             
         return issues
     
-    def validate_feature_sizes(self, objects: Dict[str, Any]) -> List[ValidationIssue]:
+    def validate_feature_sizes(self, objects: Union[Dict[str, Any], GeometryArrays]) -> List[ValidationIssue]:
         """Validate minimum feature sizes"""
         issues = []
         
         try:
-            for obj_name, obj_data in objects.items():
-                features = obj_data.get("features", [])
+            arrays = _as_geometry_arrays(objects)
+            description, recommendation = _feature_size_messages(self.min_feature_size)
+            feature_size = arrays.feature_size
+            flagged = self._flag_small_features(arrays)
+            
+            issues = [None] * len(flagged)
+            for k, i in enumerate(flagged):
+                feature_type = arrays.feature_type[i]
+                size = feature_size[i]
                 
-                for feature in features:
-                    feature_type = feature.get("type")
-                    size = feature.get("size", 0)
-                    
-                    if size < self.min_feature_size:
-                        severity = ValidationSeverity.ERROR if size < 0.2 else ValidationSeverity.WARNING
-                        
-                        issues.append(ValidationIssue(
-                            category=ValidationCategory.GEOMETRY,
-                            severity=severity,
-                            title="Feature Too Small",
-                            description=f"{feature_type} feature size {size:.2f}mm is below minimum {self.min_feature_size:.2f}mm",
-                            affected_objects=[obj_name],
-                            location=feature.get("location"),
-                            recommendation=f"Increase {feature_type} size to at least {self.min_feature_size:.2f}mm",
-                            cost_impact=0.05,
-                            time_impact=1.0
-                        ))
+                issues[k] = _FEATURE_SIZE_ISSUE(
+                    severity=_SEVERITY_BY_RANK[1 + (size < 0.2)],
+                    description=description.format(feature_type, size),
+                    affected_objects=[arrays.names[arrays.feature_owner[i]]],
+                    location=arrays.feature_location[i],
+                    recommendation=recommendation.format(feature_type)
+                )
                         
         except Exception as e:
             logger.error(f"Feature size validation failed: {e}")
+            issues = [issue for issue in issues if issue is not None]
             
         return issues
     
-    def validate_hole_geometry(self, objects: Dict[str, Any]) -> List[ValidationIssue]:
+    def _flag_thin_walls(self, arrays: GeometryArrays) -> List[int]:
+        """Rows of the face columns below the minimum wall thickness"""
+        min_wall_thickness = self.min_wall_thickness
+        return [i for i, thickness in enumerate(arrays.face_thickness) if 0 < thickness < min_wall_thickness]
+    
+    def _flag_small_features(self, arrays: GeometryArrays) -> List[int]:
+        """Rows of the feature columns below the minimum feature size"""
+        min_feature_size = self.min_feature_size
+        return [i for i, size in enumerate(arrays.feature_size) if size < min_feature_size]
+    
+    def severity_counts(self, objects: Union[Dict[str, Any], GeometryArrays]) -> Dict[ValidationSeverity, int]:
+        """Number of issues the geometry checks would report, by severity, without building them"""
+        counts = {_WARN: 0, _ERR: 0}
+        
+        try:
+            arrays = _as_geometry_arrays(objects)
+            
+            face_thickness = arrays.face_thickness
+            flagged = self._flag_thin_walls(arrays)
+            thin_errors = sum(1 for i in flagged if face_thickness[i] < 0.3)
+            counts[_ERR] += thin_errors
+            counts[_WARN] += len(flagged) - thin_errors
+            
+            feature_size = arrays.feature_size
+            flagged = self._flag_small_features(arrays)
+            small_errors = sum(1 for i in flagged if feature_size[i] < 0.2)
+            counts[_ERR] += small_errors
+            counts[_WARN] += len(flagged) - small_errors
+            
+            # Every hole flag bit is one warning
+            hole_flags = _screen_holes(arrays.hole_diameter, arrays.hole_depth, self.max_aspect_ratio, 1.0)
+            counts[_WARN] += sum((flags & HOLE_HIGH_ASPECT) + ((flags & HOLE_SMALL_DIAMETER) >> 1)
+                                 for flags in hole_flags)
+            
+        except Exception as e:
+            logger.error(f"Geometry issue counting failed: {e}")
+            
+        return counts
+    
+    def validate_hole_geometry(self, objects: Union[Dict[str, Any], GeometryArrays]) -> List[ValidationIssue]:
         """Validate hole geometry and aspect ratios"""
         issues = []
         
         try:
-            for obj_name, obj_data in objects.items():
-                holes = obj_data.get("holes", [])
+            arrays = _as_geometry_arrays(objects)
+            max_aspect_ratio = self.max_aspect_ratio
+            hole_diameter = arrays.hole_diameter
+            hole_flags = _screen_holes(hole_diameter, arrays.hole_depth, max_aspect_ratio, 1.0)
+            
+            for i, flags in enumerate(hole_flags):
+                if not flags:
+                    continue
+                diameter = hole_diameter[i]
+                obj_name = arrays.names[arrays.hole_owner[i]]
+                position = arrays.hole_position[i]
                 
-                for hole in holes:
-                    diameter = hole.get("diameter", 0)
-                    depth = hole.get("depth", 0)
-                    
-                    if diameter > 0 and depth > 0:
-                        aspect_ratio = depth / diameter
-                        
-                        if aspect_ratio > self.max_aspect_ratio:
-                            issues.append(ValidationIssue(
-                                category=ValidationCategory.GEOMETRY,
-                                severity=ValidationSeverity.WARNING,
-                                title="High Aspect Ratio Hole",
-                                description=f"Hole aspect ratio {aspect_ratio:.1f} exceeds recommended maximum {self.max_aspect_ratio}",
-                                affected_objects=[obj_name],
-                                location=hole.get("position"),
-                                recommendation="Consider stepped drilling or reduce depth",
-                                cost_impact=0.15,
-                                time_impact=1.5
-                            ))
-                        
-                        # Check minimum hole diameter
-                        if diameter < 1.0:
-                            issues.append(ValidationIssue(
-                                category=ValidationCategory.GEOMETRY,
-                                severity=ValidationSeverity.WARNING,
-                                title="Small Hole Diameter",
-                                description=f"Hole diameter {diameter:.2f}mm may be difficult to manufacture accurately",
-                                affected_objects=[obj_name],
-                                location=hole.get("position"),
-                                recommendation="Consider increasing diameter or using specialized tooling",
-                                cost_impact=0.08,
-                                time_impact=0.5
-                            ))
+                if flags & HOLE_HIGH_ASPECT:
+                    aspect_ratio = arrays.hole_depth[i] / diameter
+                    issues.append(_HIGH_ASPECT_HOLE_ISSUE(
+                        description=f"Hole aspect ratio {aspect_ratio:.1f} exceeds recommended maximum {max_aspect_ratio}",
+                        affected_objects=[obj_name],
+                        location=position
+                    ))
+                
+                # Check minimum hole diameter
+                if flags & HOLE_SMALL_DIAMETER:
+                    issues.append(_SMALL_HOLE_ISSUE(
+                        description=f"Hole diameter {diameter:.2f}mm may be difficult to manufacture accurately",
+                        affected_objects=[obj_name],
+                        location=position
+                    ))
                             
         except Exception as e:
             logger.error(f"Hole geometry validation failed: {e}")
             
         return issues
 
+# Typed read-only views of the per-object manufacturing inputs; built once per
+# object so the process checks use attribute access instead of dict.get chains
+
+class Overhang(NamedTuple):
+    """Overhanging region for FDM printing"""
+    angle: float
+    location: Optional[Tuple[float, float, float]]
+
+class Bridge(NamedTuple):
+    """Unsupported bridge span for FDM printing"""
+    length: float
+    location: Optional[Tuple[float, float, float]]
+
+class Pocket(NamedTuple):
+    """Machined pocket"""
+    depth: float
+    width: float
+    location: Optional[Tuple[float, float, float]]
+
+class InternalCorner(NamedTuple):
+    """Internal corner that a cutter must reach"""
+    radius: float
+    location: Optional[Tuple[float, float, float]]
+
+class DraftSurface(NamedTuple):
+    """Vertical surface pulled from a mold"""
+    draft_angle: float
+    location: Optional[Tuple[float, float, float]]
+
+def _as_overhangs(obj_data: Dict[str, Any]) -> List[Overhang]:
+    return [Overhang(o.get("angle", 90), o.get("location")) for o in obj_data.get("overhangs", [])]
+
+def _as_bridges(obj_data: Dict[str, Any]) -> List[Bridge]:
+    return [Bridge(b.get("length", 0), b.get("location")) for b in obj_data.get("bridges", [])]
+
+def _as_pockets(obj_data: Dict[str, Any]) -> List[Pocket]:
+    return [Pocket(p.get("depth", 0), p.get("width", 0), p.get("location"))
+            for p in obj_data.get("pockets", [])]
+
+def _as_internal_corners(obj_data: Dict[str, Any]) -> List[InternalCorner]:
+    return [InternalCorner(c.get("radius", 0), c.get("location")) for c in obj_data.get("internal_corners", [])]
+
+def _as_draft_surfaces(obj_data: Dict[str, Any]) -> List[DraftSurface]:
+    return [DraftSurface(f.get("draft_angle", 0), f.get("location")) for f in obj_data.get("vertical_surfaces", [])]
+
+class ProcessParamsMapping(Mapping):
+    """Dict-style access to the fields of a process parameter dataclass
+    
+    ManufacturingValidator.processes used to hold plain dicts, so
+    ``processes["cnc_machining"]["min_corner_radius"]`` reads and assignments
+    keep working on the typed parameters.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: str) -> float:
+        if key not in self._field_names():
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value: float) -> None:
+        if key not in self._field_names():
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._field_names())
+    
+    def __len__(self) -> int:
+        return len(self._field_names())
+    
+    @classmethod
+    def _field_names(cls) -> Tuple[str, ...]:
+        return tuple(f.name for f in fields(cls))
+
+@dataclass(slots=True)
+class FDMParams(ProcessParamsMapping):
+    """Design limits for FDM 3D printing"""
+    min_wall_thickness: float
+    min_feature_size: float
+    max_overhang_angle: float
+    min_clearance: float
+
+@dataclass(slots=True)
+class CNCParams(ProcessParamsMapping):
+    """Design limits for CNC machining"""
+    min_wall_thickness: float
+    min_feature_size: float
+    min_corner_radius: float
+    max_aspect_ratio: float
+
+@dataclass(slots=True)
+class MoldingParams(ProcessParamsMapping):
+    """Design limits for injection molding"""
+    min_wall_thickness: float
+    max_wall_thickness: float
+    min_draft_angle: float
+    min_corner_radius: float
+
+ProcessParams = Union[FDMParams, CNCParams, MoldingParams]
+
+# Process checks specialised to one set of limits: thresholds and messages are bound
+# once when the check is made, not read per element
+
+def _make_fdm_check(params: FDMParams) -> Callable[[str, Dict[str, Any], List[ValidationIssue]], None]:
+    """Per-object FDM check with the process limits baked in as constants"""
+    max_overhang_angle = params.max_overhang_angle
+    overhang_description = "Overhang angle {}° exceeds maximum %s° for FDM printing" % (max_overhang_angle,)
+    
+    def check(obj_name: str, obj_data: Dict[str, Any], issues: List[ValidationIssue]) -> None:
+        # Check overhangs
+        for overhang in _as_overhangs(obj_data):
+            angle = overhang.angle
+            if angle > max_overhang_angle:
+                issues.append(ValidationIssue(
+                    category=_MFG,
+                    severity=_WARN,
+                    title="Unsupported Overhang",
+                    description=overhang_description.format(angle),
+                    affected_objects=[obj_name],
+                    location=overhang.location,
+                    recommendation="Add support structures or redesign geometry",
+                    cost_impact=0.2,
+                    time_impact=3.0
+                ))
+        
+        # Check bridging
+        for bridge in _as_bridges(obj_data):
+            length = bridge.length
+            if length > 20:  # mm
+                issues.append(ValidationIssue(
+                    category=_MFG,
+                    severity=_WARN,
+                    title="Long Bridge",
+                    description=f"Bridge length {length:.1f}mm may cause sagging in FDM printing",
+                    affected_objects=[obj_name],
+                    location=bridge.location,
+                    recommendation="Add intermediate supports or reduce bridge length",
+                    cost_impact=0.1,
+                    time_impact=2.0
+                ))
+    
+    return check
+
+def _make_cnc_check(params: CNCParams) -> Callable[[str, Dict[str, Any], List[ValidationIssue]], None]:
+    """Per-object CNC machining check with the process limits baked in as constants"""
+    max_aspect_ratio = params.max_aspect_ratio
+    min_corner_radius = params.min_corner_radius
+    corner_description, corner_recommendation = _corner_radius_messages(min_corner_radius)
+    
+    def check(obj_name: str, obj_data: Dict[str, Any], issues: List[ValidationIssue]) -> None:
+        # Check tool access
+        for pocket in _as_pockets(obj_data):
+            depth = pocket.depth
+            width = pocket.width
+            
+            if width > 0 and depth / width > max_aspect_ratio:
+                issues.append(ValidationIssue(
+                    category=_MFG,
+                    severity=_ERR,
+                    title="Deep Narrow Pocket",
+                    description=f"Pocket aspect ratio {depth/width:.1f} exceeds CNC tooling limits",
+                    affected_objects=[obj_name],
+                    location=pocket.location,
+                    recommendation="Increase pocket width or reduce depth",
+                    cost_impact=0.3,
+                    time_impact=4.0
+                ))
+        
+        # Check internal corners
+        for corner in _as_internal_corners(obj_data):
+            radius = corner.radius
+            if radius < min_corner_radius:
+                issues.append(ValidationIssue(
+                    category=_MFG,
+                    severity=_WARN,
+                    title="Sharp Internal Corner",
+                    description=corner_description.format(radius),
+                    affected_objects=[obj_name],
+                    location=corner.location,
+                    recommendation=corner_recommendation,
+                    cost_impact=0.1,
+                    time_impact=1.0
+                ))
+    
+    return check
+
+def _make_molding_check(params: MoldingParams) -> Callable[[str, Dict[str, Any], List[ValidationIssue]], None]:
+    """Per-object injection molding check with the process limits baked in as constants"""
+    min_draft_angle = params.min_draft_angle
+    draft_description, draft_recommendation = _draft_angle_messages(min_draft_angle)
+    
+    def check(obj_name: str, obj_data: Dict[str, Any], issues: List[ValidationIssue]) -> None:
+        # Check draft angles
+        for surface in _as_draft_surfaces(obj_data):
+            draft_angle = surface.draft_angle
+            if draft_angle < min_draft_angle:
+                issues.append(ValidationIssue(
+                    category=_MFG,
+                    severity=_ERR,
+                    title="Insufficient Draft Angle",
+                    description=draft_description.format(draft_angle),
+                    affected_objects=[obj_name],
+                    location=surface.location,
+                    recommendation=draft_recommendation,
+                    cost_impact=0.25,
+                    time_impact=3.0
+                ))
+        
+        # Check wall thickness variation
+        wall_thickness_variation = obj_data.get("wall_thickness_variation", 0)
+        if wall_thickness_variation > 0.5:  # 50% variation
+            issues.append(ValidationIssue(
+                category=_MFG,
+                severity=_WARN,
+                title="High Wall Thickness Variation",
+                description=f"Wall thickness variation {wall_thickness_variation*100:.0f}% may cause warping",
+                affected_objects=[obj_name],
+                recommendation="Aim for uniform wall thickness",
+                cost_impact=0.15,
+                time_impact=2.5
+            ))
+    
+    return check
+
+# Parameter type and check factory per process name
+_PROCESS_CHECK_FACTORIES = {
+    "fdm_3d_printing": (FDMParams, _make_fdm_check),
+    "cnc_machining": (CNCParams, _make_cnc_check),
+    "injection_molding": (MoldingParams, _make_molding_check),
+}
+
 class ManufacturingValidator:
     """Validates manufacturability for different processes"""
     
-    def __init__(self):
-        self.processes = {
-            "fdm_3d_printing": {
-                "min_wall_thickness": 1.2,
-                "min_feature_size": 0.8,
-                "max_overhang_angle": 45,
-                "min_clearance": 0.4
-            },
-            "cnc_machining": {
-                "min_wall_thickness": 0.5,
-                "min_feature_size": 0.1,
-                "min_corner_radius": 0.1,
-                "max_aspect_ratio": 10
-            },
-            "injection_molding": {
-                "min_wall_thickness": 0.8,
-                "max_wall_thickness": 4.0,
-                "min_draft_angle": 0.5,
-                "min_corner_radius": 0.25
-            }
+    # Object fields read by the process checks; only these feed the result cache key
+    _CACHE_FIELDS = ("overhangs", "bridges", "pockets", "internal_corners",
+                     "vertical_surfaces", "wall_thickness_variation")
+    
+    def __init__(self, cache_size: int = 128):
+        # LRU of validate_for_process results keyed by a digest of the inputs
+        self._cache: "OrderedDict[bytes, List[ValidationIssue]]" = OrderedDict()
+        self._cache_size = cache_size
+
+        self.processes: Dict[str, Union[ProcessParams, Dict[str, float]]] = {
+            "fdm_3d_printing": FDMParams(
+                min_wall_thickness=1.2,
+                min_feature_size=0.8,
+                max_overhang_angle=45,
+                min_clearance=0.4
+            ),
+            "cnc_machining": CNCParams(
+                min_wall_thickness=0.5,
+                min_feature_size=0.1,
+                min_corner_radius=0.1,
+                max_aspect_ratio=10
+            ),
+            "injection_molding": MoldingParams(
+                min_wall_thickness=0.8,
+                max_wall_thickness=4.0,
+                min_draft_angle=0.5,
+                min_corner_radius=0.25
+            )
         }
     
     def validate_for_process(self, objects: Dict[str, Any], process: str) -> List[ValidationIssue]:
@@ -221,140 +713,73 @@ class ManufacturingValidator:
         
         process_params = self.processes[process]
         
+        cache_key = self._cache_key(objects, process, process_params)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        check = self.process_check(process)
         try:
-            if process == "fdm_3d_printing":
-                issues.extend(self._validate_fdm_3d_printing(objects, process_params))
-            elif process == "cnc_machining":
-                issues.extend(self._validate_cnc_machining(objects, process_params))
-            elif process == "injection_molding":
-                issues.extend(self._validate_injection_molding(objects, process_params))
+            if check is not None:
+                for obj_name, obj_data in objects.items():
+                    check(obj_name, obj_data, issues)
                 
         except Exception as e:
             logger.error(f"Manufacturing validation for {process} failed: {e}")
-            
-        return issues
-    
-    def _validate_fdm_3d_printing(self, objects: Dict[str, Any], params: Dict[str, Any]) -> List[ValidationIssue]:
-        """Validate for FDM 3D printing"""
-        issues = []
+            return issues  # Partial results are never cached
         
-        for obj_name, obj_data in objects.items():
-            # Check overhangs
-            overhangs = obj_data.get("overhangs", [])
-            for overhang in overhangs:
-                angle = overhang.get("angle", 90)
-                if angle > params["max_overhang_angle"]:
-                    issues.append(ValidationIssue(
-                        category=ValidationCategory.MANUFACTURING,
-                        severity=ValidationSeverity.WARNING,
-                        title="Unsupported Overhang",
-                        description=f"Overhang angle {angle}° exceeds maximum {params['max_overhang_angle']}° for FDM printing",
-                        affected_objects=[obj_name],
-                        location=overhang.get("location"),
-                        recommendation="Add support structures or redesign geometry",
-                        cost_impact=0.2,
-                        time_impact=3.0
-                    ))
+        self._cache_put(cache_key, issues)
             
-            # Check bridging
-            bridges = obj_data.get("bridges", [])
-            for bridge in bridges:
-                length = bridge.get("length", 0)
-                if length > 20:  # mm
-                    issues.append(ValidationIssue(
-                        category=ValidationCategory.MANUFACTURING,
-                        severity=ValidationSeverity.WARNING,
-                        title="Long Bridge",
-                        description=f"Bridge length {length:.1f}mm may cause sagging in FDM printing",
-                        affected_objects=[obj_name],
-                        location=bridge.get("location"),
-                        recommendation="Add intermediate supports or reduce bridge length",
-                        cost_impact=0.1,
-                        time_impact=2.0
-                    ))
-        
         return issues
     
-    def _validate_cnc_machining(self, objects: Dict[str, Any], params: Dict[str, Any]) -> List[ValidationIssue]:
-        """Validate for CNC machining"""
-        issues = []
+    def process_check(self, process: str) -> Optional[Callable[[str, Dict[str, Any], List[ValidationIssue]], None]]:
+        """Per-object check for a process, specialised to its current limits
         
-        for obj_name, obj_data in objects.items():
-            # Check tool access
-            pockets = obj_data.get("pockets", [])
-            for pocket in pockets:
-                depth = pocket.get("depth", 0)
-                width = pocket.get("width", 0)
-                
-                if width > 0 and depth / width > params["max_aspect_ratio"]:
-                    issues.append(ValidationIssue(
-                        category=ValidationCategory.MANUFACTURING,
-                        severity=ValidationSeverity.ERROR,
-                        title="Deep Narrow Pocket",
-                        description=f"Pocket aspect ratio {depth/width:.1f} exceeds CNC tooling limits",
-                        affected_objects=[obj_name],
-                        location=pocket.get("location"),
-                        recommendation="Increase pocket width or reduce depth",
-                        cost_impact=0.3,
-                        time_impact=4.0
-                    ))
-            
-            # Check internal corners
-            corners = obj_data.get("internal_corners", [])
-            for corner in corners:
-                radius = corner.get("radius", 0)
-                if radius < params["min_corner_radius"]:
-                    issues.append(ValidationIssue(
-                        category=ValidationCategory.MANUFACTURING,
-                        severity=ValidationSeverity.WARNING,
-                        title="Sharp Internal Corner",
-                        description=f"Internal corner radius {radius:.2f}mm is below minimum {params['min_corner_radius']:.2f}mm for CNC",
-                        affected_objects=[obj_name],
-                        location=corner.get("location"),
-                        recommendation=f"Add fillet with radius ≥ {params['min_corner_radius']:.2f}mm",
-                        cost_impact=0.1,
-                        time_impact=1.0
-                    ))
-        
-        return issues
+        Limits may also have been replaced with a plain dict of the same fields.
+        """
+        params = self.processes.get(process)
+        entry = _PROCESS_CHECK_FACTORIES.get(process)
+        if params is None or entry is None:
+            return None
+        params_type, make_check = entry
+        if not isinstance(params, params_type):
+            params = params_type(**{name: params[name] for name in params_type._field_names()})
+        return make_check(params)
     
-    def _validate_injection_molding(self, objects: Dict[str, Any], params: Dict[str, Any]) -> List[ValidationIssue]:
-        """Validate for injection molding"""
-        issues = []
-        
-        for obj_name, obj_data in objects.items():
-            # Check draft angles
-            surfaces = obj_data.get("vertical_surfaces", [])
-            for surface in surfaces:
-                draft_angle = surface.get("draft_angle", 0)
-                if draft_angle < params["min_draft_angle"]:
-                    issues.append(ValidationIssue(
-                        category=ValidationCategory.MANUFACTURING,
-                        severity=ValidationSeverity.ERROR,
-                        title="Insufficient Draft Angle",
-                        description=f"Draft angle {draft_angle:.2f}° is below minimum {params['min_draft_angle']:.2f}° for injection molding",
-                        affected_objects=[obj_name],
-                        location=surface.get("location"),
-                        recommendation=f"Add draft angle ≥ {params['min_draft_angle']:.2f}°",
-                        cost_impact=0.25,
-                        time_impact=3.0
-                    ))
-            
-            # Check wall thickness variation
-            wall_thickness_variation = obj_data.get("wall_thickness_variation", 0)
-            if wall_thickness_variation > 0.5:  # 50% variation
-                issues.append(ValidationIssue(
-                    category=ValidationCategory.MANUFACTURING,
-                    severity=ValidationSeverity.WARNING,
-                    title="High Wall Thickness Variation",
-                    description=f"Wall thickness variation {wall_thickness_variation*100:.0f}% may cause warping",
-                    affected_objects=[obj_name],
-                    recommendation="Aim for uniform wall thickness",
-                    cost_impact=0.15,
-                    time_impact=2.5
-                ))
-        
-        return issues
+    def _cache_get(self, cache_key: Optional[bytes]) -> Optional[List[ValidationIssue]]:
+        """Copy of a cached result, marking it most recently used"""
+        if cache_key is None:
+            return None
+        cached = self._cache.get(cache_key)
+        if cached is None:
+            return None
+        self._cache.move_to_end(cache_key)
+        return _copy_issues(cached)
+    
+    def _cache_put(self, cache_key: Optional[bytes], issues: List[ValidationIssue]) -> None:
+        """Store a complete result, evicting the least recently used entry when full"""
+        if cache_key is None:
+            return
+        self._cache[cache_key] = _copy_issues(issues)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+    
+    def _cache_key(self, objects: Dict[str, Any], process: str,
+                   process_params: Mapping[str, float]) -> Optional[bytes]:
+        """Digest of the inputs validate_for_process depends on, or None to bypass the cache"""
+        try:
+            fields = self._CACHE_FIELDS
+            payload = json.dumps(
+                [process, dict(process_params),
+                 [[obj_name, {k: obj_data[k] for k in fields if k in obj_data}]
+                  for obj_name, obj_data in objects.items()]],
+                sort_keys=True,
+                separators=(",", ":")
+            )
+        except (TypeError, ValueError, AttributeError):
+            return None
+        # A 16 byte digest keeps the cache's keys compact
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
 
 class StructuralValidator:
     """Validates structural integrity and mechanical properties"""
@@ -370,32 +795,35 @@ class StructuralValidator:
         
         try:
             for obj_name, obj_data in objects.items():
-                stress_concentrations = obj_data.get("stress_concentrations", [])
-                
-                for concentration in stress_concentrations:
-                    factor = concentration.get("concentration_factor", 1.0)
-                    location = concentration.get("location")
-                    
-                    if factor > 3.0:
-                        severity = ValidationSeverity.ERROR if factor > 5.0 else ValidationSeverity.WARNING
-                        
-                        issues.append(ValidationIssue(
-                            category=ValidationCategory.STRUCTURAL,
-                            severity=severity,
-                            title="High Stress Concentration",
-                            description=f"Stress concentration factor {factor:.1f} at critical location",
-                            affected_objects=[obj_name],
-                            location=location,
-                            recommendation="Add fillets or chamfers to reduce stress concentration",
-                            cost_impact=0.1,
-                            time_impact=2.0
-                        ))
+                self.check_stress_concentrations(obj_name, obj_data, issues)
                         
         except Exception as e:
             logger.error(f"Stress concentration validation failed: {e}")
             
         return issues
     
+    def check_stress_concentrations(self, obj_name: str, obj_data: Dict[str, Any],
+                                    issues: List[ValidationIssue]) -> None:
+        """Validate the stress concentrations of one object, appending to issues"""
+        stress_concentrations = obj_data.get("stress_concentrations", [])
+        
+        for concentration in stress_concentrations:
+            factor = concentration.get("concentration_factor", 1.0)
+            location = concentration.get("location")
+            
+            if factor > 3.0:
+                issues.append(ValidationIssue(
+                    category=_STRUCT,
+                    severity=_SEVERITY_BY_RANK[1 + (factor > 5.0)],
+                    title="High Stress Concentration",
+                    description=f"Stress concentration factor {factor:.1f} at critical location",
+                    affected_objects=[obj_name],
+                    location=location,
+                    recommendation="Add fillets or chamfers to reduce stress concentration",
+                    cost_impact=0.1,
+                    time_impact=2.0
+                ))
+    
     def validate_load_paths(self, objects: Dict[str, Any], loads: Dict[str, Any]) -> List[ValidationIssue]:
         """Validate load transfer paths"""
         issues = []
@@ -410,8 +838,8 @@ class StructuralValidator:
                 
                 if not supports:
                     issues.append(ValidationIssue(
-                        category=ValidationCategory.STRUCTURAL,
-                        severity=ValidationSeverity.CRITICAL,
+                        category=_STRUCT,
+                        severity=_CRIT,
                         title="No Load Path to Support",
                         description=f"Load {load_name} ({magnitude:.1f}N) has no clear path to supports",
                         affected_objects=load_data.get("affected_objects", []),
@@ -427,8 +855,8 @@ class StructuralValidator:
                 
                 if stress > self.max_stress / self.safety_factor:
                     issues.append(ValidationIssue(
-                        category=ValidationCategory.STRUCTURAL,
-                        severity=ValidationSeverity.ERROR,
+                        category=_STRUCT,
+                        severity=_ERR,
                         title="Excessive Stress",
                         description=f"Calculated stress {stress/1e6:.1f}MPa exceeds allowable {self.max_stress/1e6/self.safety_factor:.1f}MPa",
                         affected_objects=load_data.get("affected_objects", []),
@@ -443,17 +871,33 @@ class StructuralValidator:
             
         return issues
 
+class ToleranceGrade(IntEnum):
+    """Standard fit tolerance grades, indexing _TOLERANCE_DEVIATIONS"""
+    H7 = 0
+    H8 = 1
+    H9 = 2
+    g6 = 3
+    f7 = 4
+
+# Fundamental deviation per ToleranceGrade, in mm for ~25mm diameter
+_TOLERANCE_DEVIATIONS = (0.025, 0.039, 0.062, -0.013, -0.025)
+
 class AssemblyValidator:
-    """Validates assembly constraints and fit tolerances"""
+    """Validates assembly constraints and fit tolerances
+    
+    Fit tolerances may be given as grade names ("H7") or as ToleranceGrade members;
+    members index the deviation table directly, so callers validating many fits can
+    convert the grades once up front.
+    """
     
     def __init__(self):
-        self.tolerance_grades = {
-            "H7": 0.025,  # mm for ~25mm diameter
-            "H8": 0.039,
-            "H9": 0.062,
-            "g6": -0.013,
-            "f7": -0.025
-        }
+        self.tolerance_grades = {grade.name: _TOLERANCE_DEVIATIONS[grade] for grade in ToleranceGrade}
+    
+    def _deviation(self, tolerance: Any) -> float:
+        """Deviation of a grade name or ToleranceGrade; unknown grades count as zero"""
+        if isinstance(tolerance, ToleranceGrade):
+            return _TOLERANCE_DEVIATIONS[tolerance]
+        return self.tolerance_grades.get(tolerance, 0)
         
     def validate_fit_tolerances(self, assemblies: Dict[str, Any]) -> List[ValidationIssue]:
         """Validate fit tolerances between mating parts"""
@@ -470,15 +914,15 @@ class AssemblyValidator:
                     nominal_size = fit.get("nominal_size", 25)  # mm
                     
                     # Calculate actual clearance/interference
-                    shaft_dev = self.tolerance_grades.get(shaft_tolerance, 0)
-                    hole_dev = self.tolerance_grades.get(hole_tolerance, 0)
+                    shaft_dev = self._deviation(shaft_tolerance)
+                    hole_dev = self._deviation(hole_tolerance)
                     
                     clearance = hole_dev - shaft_dev
                     
                     if fit_type == "clearance" and clearance <= 0:
                         issues.append(ValidationIssue(
-                            category=ValidationCategory.ASSEMBLY,
-                            severity=ValidationSeverity.ERROR,
+                            category=_ASM,
+                            severity=_ERR,
                             title="Insufficient Clearance",
                             description=f"Clearance fit has {clearance*1000:.1f}μm clearance (should be positive)",
                             affected_objects=[fit.get("shaft_part"), fit.get("hole_part")],
@@ -489,8 +933,8 @@ class AssemblyValidator:
                     
                     elif fit_type == "interference" and clearance >= 0:
                         issues.append(ValidationIssue(
-                            category=ValidationCategory.ASSEMBLY,
-                            severity=ValidationSeverity.ERROR,
+                            category=_ASM,
+                            severity=_ERR,
                             title="Insufficient Interference",
                             description=f"Interference fit has {clearance*1000:.1f}μm clearance (should be negative)",
                             affected_objects=[fit.get("shaft_part"), fit.get("hole_part")],
@@ -519,8 +963,8 @@ class AssemblyValidator:
                     
                     if not tool_access:
                         issues.append(ValidationIssue(
-                            category=ValidationCategory.ASSEMBLY,
-                            severity=ValidationSeverity.WARNING,
+                            category=_ASM,
+                            severity=_WARN,
                             title="Limited Tool Access",
                             description=f"Step {step_idx + 1}: Limited tool access for {part_name}",
                             affected_objects=[part_name],
@@ -531,8 +975,8 @@ class AssemblyValidator:
                     
                     if not clearance_available:
                         issues.append(ValidationIssue(
-                            category=ValidationCategory.ASSEMBLY,
-                            severity=ValidationSeverity.ERROR,
+                            category=_ASM,
+                            severity=_ERR,
                             title="Insufficient Assembly Clearance",
                             description=f"Step {step_idx + 1}: Insufficient clearance for {part_name}",
                             affected_objects=[part_name],
@@ -575,32 +1019,38 @@ class CostValidator:
         }
         
         try:
+            material_costs = self.material_costs
+            cost_breakdown = cost_analysis["cost_breakdown"]
+            
             for obj_name, obj_data in objects.items():
                 material = obj_data.get("material", "aluminum")
                 volume = obj_data.get("volume", 0)  # cm³
                 density = obj_data.get("density", 2.7)  # g/cm³ (aluminum default)
                 
                 mass = volume * density / 1000  # kg
-                unit_cost = self.material_costs.get(material.lower(), 5.0)
-                total_cost = mass * unit_cost
+                unit_cost = material_costs.get(material.lower(), 5.0)
                 
-                cost_analysis["cost_breakdown"][obj_name] = {
+                cost_breakdown[obj_name] = {
                     "material": material,
                     "volume_cm3": volume,
                     "mass_kg": mass,
                     "unit_cost_per_kg": unit_cost,
-                    "total_cost": total_cost
+                    "total_cost": mass * unit_cost
                 }
-                
-                cost_analysis["total_cost"] += total_cost
-                
-                # Identify cost drivers
-                if total_cost > cost_analysis["total_cost"] * 0.3:
-                    cost_analysis["cost_drivers"].append({
-                        "object": obj_name,
-                        "cost": total_cost,
-                        "reason": f"High material cost ({material})" if unit_cost > 10 else "Large volume"
-                    })
+            
+            cost_analysis["total_cost"] = sum(entry["total_cost"] for entry in cost_breakdown.values())
+            
+            # Identify cost drivers against the final total, not the running one
+            driver_threshold = cost_analysis["total_cost"] * 0.3
+            cost_analysis["cost_drivers"] = [
+                {
+                    "object": obj_name,
+                    "cost": entry["total_cost"],
+                    "reason": f"High material cost ({entry['material']})" if entry["unit_cost_per_kg"] > 10 else "Large volume"
+                }
+                for obj_name, entry in cost_breakdown.items()
+                if entry["total_cost"] > driver_threshold
+            ]
                     
         except Exception as e:
             logger.error(f"Material cost estimation failed: {e}")
@@ -618,10 +1068,10 @@ class CostValidator:
             
             if actual_cost > target_cost:
                 cost_ratio = actual_cost / target_cost
-                severity = ValidationSeverity.CRITICAL if cost_ratio > 2.0 else ValidationSeverity.WARNING
+                severity = _CRIT if cost_ratio > 2.0 else _WARN
                 
                 issues.append(ValidationIssue(
-                    category=ValidationCategory.COST,
+                    category=_COST,
                     severity=severity,
                     title="Cost Target Exceeded",
                     description=f"Estimated cost ${actual_cost:.2f} exceeds target ${target_cost:.2f} by {(cost_ratio-1)*100:.0f}%",
@@ -633,8 +1083,8 @@ class CostValidator:
                 # Suggest specific optimizations for cost drivers
                 for driver in cost_analysis["cost_drivers"]:
                     issues.append(ValidationIssue(
-                        category=ValidationCategory.COST,
-                        severity=ValidationSeverity.INFO,
+                        category=_COST,
+                        severity=_INFO,
                         title="Cost Optimization Opportunity",
                         description=f"{driver['object']}: ${driver['cost']:.2f} - {driver['reason']}",
                         affected_objects=[driver["object"]],
@@ -646,6 +1096,81 @@ class CostValidator:
             
         return issues
 
+# Score penalty per issue, indexed by severity idx: info, warning, error, critical
+_SEVERITY_WEIGHTS = (1, 10, 25, 50)
+
+def _reduce_issues(table: IssueTable) -> Tuple[List[int], List[int], float, float]:
+    """Issue counts indexed by severity and category idx, and the summed cost and time impact
+    
+    Every reduction runs over one column of the table, without touching the issues.
+    """
+    severity_idx = table.severity_idx
+    category_idx = table.category_idx
+    return ([severity_idx.count(idx) for idx in range(len(_SEVERITIES))],
+            [category_idx.count(idx) for idx in range(len(_CATEGORIES))],
+            sum(table.cost_impact, 0.0),
+            sum(table.time_impact, 0.0))
+
+@lru_cache(maxsize=256)
+def _recommendations_for(score_bucket: int, category_counts: Tuple[int, ...],
+                         critical_count: int, has_high_cost: bool) -> Tuple[str, ...]:
+    """Recommendations for a score bucket (score // 10) and idx-indexed category counts"""
+    recommendations = []
+    
+    # Priority recommendations based on score
+    if score_bucket < 3:
+        recommendations.append("🔴 Design requires major revision - multiple critical issues detected")
+    elif score_bucket < 6:
+        recommendations.append("🟡 Design needs significant improvements before production")
+    elif score_bucket < 8:
+        recommendations.append("🟢 Design is acceptable but optimization recommended")
+    else:
+        recommendations.append("✅ Design meets validation criteria")
+    
+    # Category-specific recommendations
+    if category_counts[_CATEGORY_IDX[_MFG]] > 3:
+        recommendations.append("Focus on manufacturability - consider DFM guidelines")
+    
+    if category_counts[_CATEGORY_IDX[_STRUCT]] > 2:
+        recommendations.append("Review structural design - add FEA analysis if needed")
+    
+    if category_counts[_CATEGORY_IDX[_ASM]] > 2:
+        recommendations.append("Optimize assembly process and tolerance stack-up")
+    
+    if category_counts[_CATEGORY_IDX[_COST]] > 1:
+        recommendations.append("Evaluate cost optimization opportunities")
+    
+    # Specific high-impact recommendations
+    if critical_count:
+        recommendations.append(f"Address {critical_count} critical issues immediately")
+    
+    if has_high_cost:
+        recommendations.append("Prioritize high-cost-impact issues for maximum ROI")
+    
+    return tuple(recommendations)
+
+# ValidationIssue's fields, as written by stream_to
+_ISSUE_RECORD_FIELDS = tuple(f.name for f in fields(ValidationIssue))
+
+# Report lines every issue has, and its optional location line
+_ISSUE_TEMPLATE = "\n**{title}**\n- *Category:* {category}\n- *Objects:* {objects}\n- *Description:* {description}\n"
+_LOCATION_TEMPLATE = "- *Location:* ({0:.1f}, {1:.1f}, {2:.1f})\n"
+
+def _format_issue(issue: ValidationIssue) -> str:
+    """Report block for one issue, with a line for each optional field it has"""
+    parts = [_ISSUE_TEMPLATE.format(title=issue.title, category=issue.category.value,
+                                    objects=", ".join(issue.affected_objects),
+                                    description=issue.description)]
+    if issue.location:
+        parts.append(_LOCATION_TEMPLATE.format(*issue.location))
+    if issue.recommendation:
+        parts.append(f"- *Recommendation:* {issue.recommendation}\n")
+    if issue.cost_impact:
+        parts.append(f"- *Cost Impact:* ${issue.cost_impact:.2f}\n")
+    if issue.time_impact:
+        parts.append(f"- *Time Impact:* {issue.time_impact:.1f} hours\n")
+    return "".join(parts)
+
 class DesignValidationSystem:
     """Main design validation system coordinator"""
     
@@ -672,146 +1197,271 @@ class DesignValidationSystem:
         
         if validation_options is None:
             validation_options = {}
-            
-        all_issues = []
         
         try:
-            # Extract data components
-            objects = design_data.get("objects", {})
-            assemblies = design_data.get("assemblies", {})
-            loads = design_data.get("loads", {})
-            manufacturing_process = validation_options.get("manufacturing_process", "cnc_machining")
-            target_cost = validation_options.get("target_cost", 100.0)
-            
-            # Geometry validation
-            if self.enabled_categories[ValidationCategory.GEOMETRY]:
-                all_issues.extend(self.geometry_validator.validate_wall_thickness(objects))
-                all_issues.extend(self.geometry_validator.validate_feature_sizes(objects))
-                all_issues.extend(self.geometry_validator.validate_hole_geometry(objects))
-            
-            # Manufacturing validation
-            if self.enabled_categories[ValidationCategory.MANUFACTURING]:
-                all_issues.extend(self.manufacturing_validator.validate_for_process(objects, manufacturing_process))
-            
-            # Structural validation
-            if self.enabled_categories[ValidationCategory.STRUCTURAL]:
-                all_issues.extend(self.structural_validator.validate_stress_concentrations(objects))
-                if loads:
-                    all_issues.extend(self.structural_validator.validate_load_paths(objects, loads))
-            
-            # Assembly validation
-            if self.enabled_categories[ValidationCategory.ASSEMBLY] and assemblies:
-                all_issues.extend(self.assembly_validator.validate_fit_tolerances(assemblies))
-                all_issues.extend(self.assembly_validator.validate_assembly_sequence(assemblies))
-            
-            # Cost validation
-            if self.enabled_categories[ValidationCategory.COST]:
-                all_issues.extend(self.cost_validator.validate_cost_optimization(objects, target_cost))
-            
-            # Calculate overall metrics
-            severity_counts = {s.value: 0 for s in ValidationSeverity}
-            category_counts = {c.value: 0 for c in ValidationCategory}
-            total_cost_impact = 0.0
-            total_time_impact = 0.0
-            
-            for issue in all_issues:
-                severity_counts[issue.severity.value] += 1
-                category_counts[issue.category.value] += 1
-                if issue.cost_impact:
-                    total_cost_impact += issue.cost_impact
-                if issue.time_impact:
-                    total_time_impact += issue.time_impact
-            
-            # Calculate overall score (0-100)
-            critical_weight = 50
-            error_weight = 25
-            warning_weight = 10
-            info_weight = 1
-            
-            penalty = (
-                severity_counts["critical"] * critical_weight +
-                severity_counts["error"] * error_weight +
-                severity_counts["warning"] * warning_weight +
-                severity_counts["info"] * info_weight
-            )
-            
-            overall_score = max(0, 100 - penalty)
-            
-            # Generate recommendations
-            recommendations = self._generate_recommendations(all_issues, overall_score)
-            
-            result = ValidationResult(
-                timestamp=datetime.now(),
-                overall_score=overall_score,
-                total_issues=len(all_issues),
-                issues_by_severity=severity_counts,
-                issues_by_category=category_counts,
-                issues=all_issues,
-                recommendations=recommendations,
-                estimated_cost_impact=total_cost_impact,
-                estimated_time_impact=total_time_impact
-            )
-            
-            logger.info(f"Design validation complete: {overall_score:.1f}/100, {len(all_issues)} issues")
-            
+            return self._validate_design_impl(design_data, validation_options)
         except Exception as e:
             logger.error(f"Design validation failed: {e}")
-            result = ValidationResult(
-                timestamp=datetime.now(),
-                overall_score=0.0,
-                total_issues=0,
-                issues_by_severity={},
-                issues_by_category={},
-                issues=[],
-                recommendations=[f"Validation failed: {e}"],
-                estimated_cost_impact=0.0,
-                estimated_time_impact=0.0
-            )
-            
+            return self._empty_result(e)
+    
+    def _validate_design_impl(self, design_data: Dict[str, Any],
+                              validation_options: Dict[str, Any]) -> ValidationResult:
+        """Run the validators and summarise their issues; errors propagate to validate_design"""
+        table = IssueTable()
+        validator_calls = self._validator_calls(design_data, validation_options, include_geometry=True)
+        
+        fail_fast = validation_options.get("fail_fast", False)
+        
+        for validator, args in validator_calls:
+            table.extend(validator(*args))
+            # With fail_fast, stop once critical issues alone floor the score
+            if fail_fast and table.severity_idx.count(_SEVERITY_IDX[_CRIT]) * _SEVERITY_WEIGHTS[_SEVERITY_IDX[_CRIT]] >= 100:
+                break
+        all_issues = table.issues
+        
+        # Calculate overall metrics
+        severity_totals, category_totals, total_cost_impact, total_time_impact = _reduce_issues(table)
+        severity_counts = {s.value: severity_totals[idx] for idx, s in enumerate(_SEVERITIES)}
+        category_counts = {c.value: category_totals[idx] for idx, c in enumerate(_CATEGORIES)}
+        
+        # Calculate overall score (0-100)
+        penalty = sum(map(mul, _SEVERITY_WEIGHTS, severity_totals))
+        
+        overall_score = max(0, 100 - penalty)
+        
+        # Generate recommendations
+        recommendations = self._generate_recommendations(table, overall_score,
+                                                         severity_totals, category_totals)
+        
+        result = ValidationResult(
+            timestamp=datetime.now(),
+            overall_score=overall_score,
+            total_issues=len(all_issues),
+            issues_by_severity=severity_counts,
+            issues_by_category=category_counts,
+            issues=all_issues,
+            recommendations=recommendations,
+            estimated_cost_impact=total_cost_impact,
+            estimated_time_impact=total_time_impact,
+            category_totals=category_totals,
+            severity_totals=severity_totals
+        )
+        
+        logger.info(f"Design validation complete: {overall_score:.1f}/100, {len(all_issues)} issues")
         return result
     
-    def _generate_recommendations(self, issues: List[ValidationIssue], overall_score: float) -> List[str]:
-        """Generate high-level recommendations based on validation results"""
-        recommendations = []
+    def _empty_result(self, error: Exception) -> ValidationResult:
+        """The result reported when validation itself fails"""
+        return ValidationResult(
+            timestamp=datetime.now(),
+            overall_score=0.0,
+            total_issues=0,
+            issues_by_severity={},
+            issues_by_category={},
+            issues=[],
+            recommendations=[f"Validation failed: {error}"],
+            estimated_cost_impact=0.0,
+            estimated_time_impact=0.0
+        )
+    
+    def iter_issues(self, design_data: Dict[str, Any],
+                    validation_options: Dict[str, Any] = None) -> Iterator[ValidationIssue]:
+        """Yield the issues of a design one validator at a time, in validate_design order"""
+        return self._iter_issues(design_data, validation_options or {}, include_geometry=True)
+    
+    def count_issues(self, design_data: Dict[str, Any],
+                     validation_options: Dict[str, Any] = None) -> Dict[str, int]:
+        """Issue counts by severity for pass/fail queries
+        
+        Geometry issues are counted straight from the screened columns and never
+        built; the remaining validators are streamed through iter_issues.
+        """
+        severity_counts = {s.value: 0 for s in _SEVERITIES}
         
         try:
-            # Count issues by category
-            category_counts = {}
-            for issue in issues:
-                cat = issue.category.value
-                category_counts[cat] = category_counts.get(cat, 0) + 1
-            
-            # Priority recommendations based on score
-            if overall_score < 30:
-                recommendations.append("🔴 Design requires major revision - multiple critical issues detected")
-            elif overall_score < 60:
-                recommendations.append("🟡 Design needs significant improvements before production")
-            elif overall_score < 80:
-                recommendations.append("🟢 Design is acceptable but optimization recommended")
-            else:
-                recommendations.append("✅ Design meets validation criteria")
-            
-            # Category-specific recommendations
-            if category_counts.get("manufacturing", 0) > 3:
-                recommendations.append("Focus on manufacturability - consider DFM guidelines")
+            if self.enabled_categories.get(ValidationCategory.GEOMETRY, False):
+                geometry = design_data.get("geometry_arrays")
+                if geometry is None:
+                    geometry = design_data.get("objects", {})
+                for severity, count in self.geometry_validator.severity_counts(geometry).items():
+                    severity_counts[severity.value] += count
             
-            if category_counts.get("structural", 0) > 2:
-                recommendations.append("Review structural design - add FEA analysis if needed")
+            for issue in self._iter_issues(design_data, validation_options or {}, include_geometry=False):
+                severity_counts[issue.severity.value] += 1
+                
+        except Exception as e:
+            logger.error(f"Issue counting failed: {e}")
             
-            if category_counts.get("assembly", 0) > 2:
-                recommendations.append("Optimize assembly process and tolerance stack-up")
+        return severity_counts
+    
+    def stream_to(self, writer: Any, design_data: Dict[str, Any],
+                  validation_options: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Write the issues of a design to writer as JSON lines while they are produced
+        
+        Only one validator's issues are held at a time; the summary counts are
+        accumulated on the way through and returned.
+        """
+        severity_counts = {s.value: 0 for s in _SEVERITIES}
+        category_counts = {c.value: 0 for c in _CATEGORIES}
+        total_issues = 0
+        
+        try:
+            for issue in self.iter_issues(design_data, validation_options):
+                record = {name: getattr(issue, name) for name in _ISSUE_RECORD_FIELDS}
+                record["category"] = issue.category.value
+                record["severity"] = issue.severity.value
+                writer.write(json.dumps(record) + "\n")
+                
+                severity_counts[record["severity"]] += 1
+                category_counts[record["category"]] += 1
+                total_issues += 1
+        
+        except Exception as e:
+            logger.error(f"Issue streaming failed: {e}")
+        
+        return {
+            "total_issues": total_issues,
+            "issues_by_severity": severity_counts,
+            "issues_by_category": category_counts
+        }
+    
+    def _iter_issues(self, design_data: Dict[str, Any], validation_options: Dict[str, Any],
+                     include_geometry: bool) -> Iterator[ValidationIssue]:
+        """Issues of every enabled validator, optionally leaving out the geometry checks"""
+        for validator, args in self._validator_calls(design_data, validation_options, include_geometry):
+            yield from validator(*args)
+    
+    def _validator_calls(self, design_data: Dict[str, Any], validation_options: Dict[str, Any],
+                         include_geometry: bool) -> List[Tuple[Callable[..., List[ValidationIssue]], Tuple[Any, ...]]]:
+        """The enabled validators and their arguments, in issue order"""
+        # Extract data components
+        objects = design_data.get("objects", {})
+        assemblies = design_data.get("assemblies", {})
+        loads = design_data.get("loads", {})
+        manufacturing_process = validation_options.get("manufacturing_process", "cnc_machining")
+        target_cost = validation_options.get("target_cost", 100.0)
+        
+        # Geometry, manufacturing and per-object structural checks share one pass over objects;
+        # geometry may also arrive already in column form
+        calls: List[Tuple[Callable[..., List[ValidationIssue]], Tuple[Any, ...]]] = [
+            (self.validate_all, (objects, manufacturing_process,
+                                 design_data.get("geometry_arrays"), include_geometry))
+        ]
+        
+        # Structural validation of the load cases
+        if self.enabled_categories.get(ValidationCategory.STRUCTURAL, False) and loads:
+            calls.append((self.structural_validator.validate_load_paths, (objects, loads)))
+        
+        # Assembly validation
+        if self.enabled_categories.get(ValidationCategory.ASSEMBLY, False) and assemblies:
+            calls.append((self.assembly_validator.validate_fit_tolerances, (assemblies,)))
+            calls.append((self.assembly_validator.validate_assembly_sequence, (assemblies,)))
+        
+        # Cost validation
+        if self.enabled_categories.get(ValidationCategory.COST, False):
+            calls.append((self.cost_validator.validate_cost_optimization, (objects, target_cost)))
+        
+        return calls
+    
+    def validate_all(self, objects: Dict[str, Any], process: str = "cnc_machining",
+                     geometry_arrays: Optional[GeometryArrays] = None,
+                     include_geometry: bool = True) -> List[ValidationIssue]:
+        """Run the enabled per-object checks in a single pass over objects
+        
+        Issues come back in the same order as calling the geometry, manufacturing
+        and stress concentration validators one after another. Callers that already
+        hold the geometry in column form can pass it as geometry_arrays, in which
+        case the face, feature and hole lists of objects are not read.
+        """
+        # Category switches read once per call; nothing to do when all three are off
+        enabled = self.enabled_categories
+        geometry_on = include_geometry and enabled.get(ValidationCategory.GEOMETRY, False)
+        manufacturing_on = enabled.get(ValidationCategory.MANUFACTURING, False)
+        structural_on = enabled.get(ValidationCategory.STRUCTURAL, False)
+        if not (geometry_on or manufacturing_on or structural_on):
+            return []
+        
+        geometry_validator = self.geometry_validator
+        manufacturing_validator = self.manufacturing_validator
+        
+        geometry_rows = None
+        if not geometry_on:
+            geometry_arrays = None
+        elif geometry_arrays is None:
+            geometry_arrays = geometry_rows = GeometryArrays()
+        
+        # Manufacturing results may already be in the validator's cache
+        manufacturing_issues: List[ValidationIssue] = []
+        process_check = None
+        process_params: Optional[Mapping[str, float]] = None
+        cache_key = None
+        if manufacturing_on:
+            if process not in manufacturing_validator.processes:
+                logger.warning(f"Unknown manufacturing process: {process}")
+            else:
+                process_params = manufacturing_validator.processes[process]
+                cache_key = manufacturing_validator._cache_key(objects, process, process_params)
+                cached = manufacturing_validator._cache_get(cache_key)
+                if cached is not None:
+                    manufacturing_issues = cached
+                    cache_key = None
+                else:
+                    process_check = manufacturing_validator.process_check(process)
+        
+        structural_issues: List[ValidationIssue] = []
+        check_stress = None
+        if structural_on:
+            check_stress = self.structural_validator.check_stress_concentrations
+        
+        # A check that fails stops for the remaining objects, as in the standalone validators
+        for obj_name, obj_data in objects.items():
+            if geometry_rows is not None:
+                # Malformed rows are skipped per column, so flattening never fails
+                geometry_rows.add_object(obj_name, obj_data)
             
-            if category_counts.get("cost", 0) > 1:
-                recommendations.append("Evaluate cost optimization opportunities")
+            if process_check is not None:
+                try:
+                    process_check(obj_name, obj_data, manufacturing_issues)
+                except Exception as e:
+                    logger.error(f"Manufacturing validation for {process} failed: {e}")
+                    process_check = None
+                    cache_key = None  # Partial results are never cached
             
-            # Specific high-impact recommendations
-            critical_issues = [i for i in issues if i.severity == ValidationSeverity.CRITICAL]
-            if critical_issues:
-                recommendations.append(f"Address {len(critical_issues)} critical issues immediately")
+            if check_stress is not None:
+                try:
+                    check_stress(obj_name, obj_data, structural_issues)
+                except Exception as e:
+                    logger.error(f"Stress concentration validation failed: {e}")
+                    check_stress = None
+        
+        manufacturing_validator._cache_put(cache_key, manufacturing_issues)
+        
+        issues: List[ValidationIssue] = []
+        if geometry_arrays is not None:
+            issues.extend(geometry_validator.validate_wall_thickness(geometry_arrays))
+            issues.extend(geometry_validator.validate_feature_sizes(geometry_arrays))
+            issues.extend(geometry_validator.validate_hole_geometry(geometry_arrays))
+        issues.extend(manufacturing_issues)
+        issues.extend(structural_issues)
+        return issues
+    
+    def _generate_recommendations(self, table: IssueTable, overall_score: float,
+                                  severity_totals: List[int], category_totals: List[int]) -> List[str]:
+        """Generate high-level recommendations based on validation results
+        
+        The idx-indexed totals come from _reduce_issues and the high-cost check
+        reads the table's cost column, so the issues themselves are not scanned.
+        """
+        recommendations = []
+        
+        try:
+            has_high_cost = max(table.cost_impact, default=0.0) > 0.3
             
-            high_cost_issues = [i for i in issues if i.cost_impact and i.cost_impact > 0.3]
-            if high_cost_issues:
-                recommendations.append("Prioritize high-cost-impact issues for maximum ROI")
+            # Recommendations depend only on this summary, so similar designs share them
+            recommendations.extend(_recommendations_for(
+                min(int(overall_score) // 10, 9), tuple(category_totals),
+                severity_totals[_SEVERITY_IDX[_CRIT]], has_high_cost
+            ))
                 
         except Exception as e:
             logger.error(f"Failed to generate recommendations: {e}")
@@ -822,7 +1472,10 @@ class DesignValidationSystem:
     def generate_validation_report(self, result: ValidationResult) -> str:
         """Generate comprehensive validation report"""
         try:
-            report = f"""
+            severity_totals = result.severity_totals
+            
+            # Sections are collected as parts and joined once at the end
+            parts = [f"""
 # Design Validation Report
 
 **Generated:** {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
@@ -830,56 +1483,45 @@ class DesignValidationSystem:
 
 ## Summary
 - **Total Issues:** {result.total_issues}
-- **Critical:** {result.issues_by_severity.get('critical', 0)}
-- **Errors:** {result.issues_by_severity.get('error', 0)}
-- **Warnings:** {result.issues_by_severity.get('warning', 0)}
-- **Info:** {result.issues_by_severity.get('info', 0)}
+- **Critical:** {severity_totals[_SEVERITY_IDX[_CRIT]]}
+- **Errors:** {severity_totals[_SEVERITY_IDX[_ERR]]}
+- **Warnings:** {severity_totals[_SEVERITY_IDX[_WARN]]}
+- **Info:** {severity_totals[_SEVERITY_IDX[_INFO]]}
 
 **Estimated Impact:**
 - **Cost Impact:** ${result.estimated_cost_impact:.2f}
 - **Time Impact:** {result.estimated_time_impact:.1f} hours
 
 ## Issues by Category
-"""
+"""]
+            append = parts.append
             
-            for category in ValidationCategory:
-                count = result.issues_by_category.get(category.value, 0)
+            category_totals = result.category_totals
+            for idx, category in enumerate(_CATEGORIES):
+                count = category_totals[idx]
                 if count > 0:
-                    report += f"- **{category.value.title()}:** {count} issues\n"
+                    append(f"- **{_CATEGORY_LABELS[category]}:** {count} issues\n")
+            
+            append("\n## Detailed Issues\n")
             
-            report += "\n## Detailed Issues\n"
+            # Group issues by severity in a single pass
+            severity_buckets = [[] for _ in _SEVERITIES]
+            for issue in result.issues:
+                severity_buckets[_SEVERITY_IDX[issue.severity]].append(issue)
             
-            # Group issues by severity
-            for severity in [ValidationSeverity.CRITICAL, ValidationSeverity.ERROR, 
-                           ValidationSeverity.WARNING, ValidationSeverity.INFO]:
-                severity_issues = [i for i in result.issues if i.severity == severity]
+            for severity in _SEVERITY_ORDER:
+                severity_issues = severity_buckets[_SEVERITY_IDX[severity]]
                 
                 if severity_issues:
-                    report += f"\n### {severity.value.upper()} ({len(severity_issues)} issues)\n"
+                    append(f"\n### {_SEVERITY_LABELS[severity]} ({len(severity_issues)} issues)\n")
                     
-                    for issue in severity_issues:
-                        report += f"\n**{issue.title}**\n"
-                        report += f"- *Category:* {issue.category.value}\n"
-                        report += f"- *Objects:* {', '.join(issue.affected_objects)}\n"
-                        report += f"- *Description:* {issue.description}\n"
-                        
-                        if issue.location:
-                            report += f"- *Location:* ({issue.location[0]:.1f}, {issue.location[1]:.1f}, {issue.location[2]:.1f})\n"
-                        
-                        if issue.recommendation:
-                            report += f"- *Recommendation:* {issue.recommendation}\n"
-                        
-                        if issue.cost_impact:
-                            report += f"- *Cost Impact:* ${issue.cost_impact:.2f}\n"
-                        
-                        if issue.time_impact:
-                            report += f"- *Time Impact:* {issue.time_impact:.1f} hours\n"
+                    parts.extend(map(_format_issue, severity_issues))
             
-            report += "\n## Recommendations\n"
+            append("\n## Recommendations\n")
             for i, rec in enumerate(result.recommendations, 1):
-                report += f"{i}. {rec}\n"
+                append(f"{i}. {rec}\n")
             
-            return report
+            return "".join(parts)
             
         except Exception as e:
             logger.error(f"Failed to generate validation report: {e}")
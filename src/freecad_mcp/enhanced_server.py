@@ -5,10 +5,13 @@ with existing FreeCAD MCP functionality.
 """
 
 import os
+import copy
 import json
+import time
 import logging
 import math
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import AsyncIterator, Dict, Any, Literal, List, Union, Tuple
 
 from mcp.server.fastmcp import FastMCP, Context
@@ -22,7 +25,7 @@ from .server import (
 
 # Import enhanced frameworks
 from .manufacturing_framework import (
-    ManufacturingFramework, MaterialType, ProcessType, ToleranceType,
+    ManufacturingFramework, MaterialType, ProcessType, ToleranceType, ToleranceCalculator,
     create_standard_material, create_machining_process
 )
 from .enhanced_spatial_framework import (
@@ -57,6 +60,30 @@ manufacturing_framework.add_material(create_standard_material("steel_mild"))
 manufacturing_framework.add_material(create_standard_material("pla"))
 manufacturing_framework.add_process(create_machining_process("cnc_milling"))
 
+# Seconds a fetched object list may be reused. FreeCADConnection.revision
+# covers every change made through a connection, but edits made in the
+# FreeCAD GUI bump no revision, so entries also expire with time.
+_OBJECT_CACHE_TTL = 5.0
+
+
+@lru_cache(maxsize=32)
+def _get_objects_cached(doc_name: str, revision: int, ttl_bucket: int) -> Tuple[Dict[str, Any], ...]:
+    """Fetch a document's objects over RPC, memoized per (doc_name, revision, ttl_bucket).
+
+    Holds at most 32 object lists in memory; stale revisions and expired
+    buckets simply age out.
+    """
+    return tuple(get_freecad_connection().get_objects(doc_name))
+
+
+def _get_objects(doc_name: str) -> List[Dict[str, Any]]:
+    """Get a private copy of a document's objects, reusing a recent fetch while unchanged"""
+    ttl_bucket = int(time.monotonic() // _OBJECT_CACHE_TTL)
+    objects = _get_objects_cached(doc_name, FreeCADConnection.revision, ttl_bucket)
+    # Callers may mutate what they get, so the cached entry itself is never handed out
+    return copy.deepcopy(list(objects))
+
+
 @asynccontextmanager
 async def enhanced_server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     """Enhanced server lifespan with framework initialization"""
@@ -126,8 +153,7 @@ def analyze_manufacturing_requirements(
     
     try:
         # Get objects from FreeCAD
-        freecad = get_freecad_connection()
-        objects = freecad.get_objects(doc_name)
+        objects = _get_objects(doc_name)
         
         # Create manufacturing analysis request
         analysis_request = {
@@ -143,7 +169,7 @@ def analyze_manufacturing_requirements(
         analysis_result = manufacturing_framework.analyze_manufacturing_requirements(analysis_request)
         
         # Format results
-        report = f"""# Manufacturing Analysis Report
+        parts = [f"""# Manufacturing Analysis Report
 
 ## Overview
 - **Material**: {analysis_result['material']['name']}
@@ -158,23 +184,23 @@ def analyze_manufacturing_requirements(
 - **Lead Time**: {analysis_result['cost_analysis']['lead_time']:.1f} days
 
 ## Manufacturing Constraints
-"""
+"""]
         
         for constraint in analysis_result.get('constraints', []):
-            report += f"- **{constraint['type']}**: {constraint['description']}\n"
+            parts.append(f"- **{constraint['type']}**: {constraint['description']}\n")
             if constraint.get('recommendation'):
-                report += f"  - *Recommendation*: {constraint['recommendation']}\n"
+                parts.append(f"  - *Recommendation*: {constraint['recommendation']}\n")
         
-        report += "\n## Process Recommendations\n"
+        parts.append("\n## Process Recommendations\n")
         for rec in analysis_result.get('recommendations', []):
-            report += f"- {rec}\n"
+            parts.append(f"- {rec}\n")
         
         if analysis_result.get('warnings'):
-            report += "\n## Warnings\n"
+            parts.append("\n## Warnings\n")
             for warning in analysis_result['warnings']:
-                report += f"- ⚠️ {warning}\n"
+                parts.append(f"- ⚠️ {warning}\n")
         
-        return [TextContent(type="text", text=report)]
+        return [TextContent(type="text", text="".join(parts))]
         
     except Exception as e:
         logger.error(f"Manufacturing analysis failed: {e}")
@@ -299,17 +325,17 @@ def create_spatial_layout(
             optimization_result = spatial_framework.optimize_layout(max_iterations=50)
         
         # Generate comprehensive report
-        report = spatial_framework.generate_layout_report()
+        parts = [spatial_framework.generate_layout_report()]
         
         if optimization_result:
-            report += f"\n## Optimization Results\n"
-            report += f"- **Initial Score**: {optimization_result['initial_score']:.1f}/100\n"
-            report += f"- **Final Score**: {optimization_result['final_score']:.1f}/100\n"
-            report += f"- **Iterations**: {optimization_result['iterations']}\n"
-            report += f"- **Improvements**: {len(optimization_result['improvements'])}\n"
+            parts.append(f"\n## Optimization Results\n")
+            parts.append(f"- **Initial Score**: {optimization_result['initial_score']:.1f}/100\n")
+            parts.append(f"- **Final Score**: {optimization_result['final_score']:.1f}/100\n")
+            parts.append(f"- **Iterations**: {optimization_result['iterations']}\n")
+            parts.append(f"- **Improvements**: {len(optimization_result['improvements'])}\n")
         
         logger.info(f"Spatial layout '{layout_name}' created successfully")
-        return [TextContent(type="text", text=report)]
+        return [TextContent(type="text", text="".join(parts))]
         
     except Exception as e:
         logger.error(f"Spatial layout creation failed: {e}")
@@ -458,29 +484,29 @@ doc.recompute()
         screenshot = freecad.get_active_screenshot()
         
         # Generate feature report
-        report = f"""# Parametric Feature Created: {feature_name}
+        parts = [f"""# Parametric Feature Created: {feature_name}
 
 ## Feature Details
 - **Type**: {feature_type}
 - **Document**: {doc_name}
 
 ## Parameters
-"""
+"""]
         for key, value in parameters.items():
-            report += f"- **{key}**: {value}\n"
+            parts.append(f"- **{key}**: {value}\n")
         
         if manufacturing_notes:
-            report += "\n## Manufacturing Analysis\n"
+            parts.append("\n## Manufacturing Analysis\n")
             for key, value in manufacturing_notes.items():
-                report += f"- **{key}**: {value}\n"
+                parts.append(f"- **{key}**: {value}\n")
         
         if update_result.get("errors"):
-            report += "\n## Parametric Update Issues\n"
+            parts.append("\n## Parametric Update Issues\n")
             for error in update_result["errors"]:
-                report += f"- ⚠️ {error}\n"
+                parts.append(f"- ⚠️ {error}\n")
         
         return [
-            TextContent(type="text", text=report),
+            TextContent(type="text", text="".join(parts)),
             ImageContent(type="image", data=screenshot, mimeType="image/png")
         ]
         
@@ -513,12 +539,10 @@ def calculate_fit_and_tolerance(
     logger.info(f"Calculating fit and tolerance for {nominal_dimension}mm {fit_type} fit")
     
     try:
-        # Calculate tolerances using manufacturing framework
-        tolerance_analysis = manufacturing_framework.calculate_tolerance_stack(
-            nominal_dimension=nominal_dimension,
-            tolerance_grade=tolerance_grade_hole,
-            fit_type=fit_type
-        )
+        # Look up limit deviations from the ISO 286 tables
+        size_step = ToleranceCalculator.iso_size_step(nominal_dimension)
+        hole_upper, hole_lower = ToleranceCalculator.fit_deviations(tolerance_grade_hole, size_step)
+        shaft_upper, shaft_lower = ToleranceCalculator.fit_deviations(tolerance_grade_shaft, size_step)
         
         # Calculate thermal effects
         material_1 = manufacturing_framework.materials.get("aluminum_6061")
@@ -528,11 +552,8 @@ def calculate_fit_and_tolerance(
             thermal_expansion_1 = 23e-6 * nominal_dimension * temperature_range  # Aluminum default
         
         # Calculate actual fit conditions
-        hole_tolerance = tolerance_analysis.get("hole_tolerance", 0.025)
-        shaft_tolerance = tolerance_analysis.get("shaft_tolerance", -0.013)
-        
-        max_clearance = hole_tolerance - shaft_tolerance + thermal_expansion_1
-        min_clearance = -hole_tolerance + shaft_tolerance + thermal_expansion_1
+        max_clearance = hole_upper - shaft_lower + thermal_expansion_1
+        min_clearance = hole_lower - shaft_upper + thermal_expansion_1
         
         # Determine fit suitability
         fit_suitability = "Suitable"
@@ -550,7 +571,7 @@ def calculate_fit_and_tolerance(
             warnings.append("Thermal expansion is significant relative to fit")
         
         # Generate comprehensive report
-        report = f"""# Fit and Tolerance Analysis
+        parts = [f"""# Fit and Tolerance Analysis
 
 ## Specifications
 - **Nominal Dimension**: {nominal_dimension:.3f} mm
@@ -560,9 +581,9 @@ def calculate_fit_and_tolerance(
 - **Temperature Range**: ±{temperature_range/2:.1f}°C
 
 ## Tolerance Analysis
-- **Hole Tolerance**: +{hole_tolerance*1000:.1f}μm / 0μm
-- **Shaft Tolerance**: {shaft_tolerance*1000:.1f}μm / {shaft_tolerance*1000:.1f}μm
-- **Fundamental Deviation**: {(hole_tolerance + shaft_tolerance)*1000:.1f}μm
+- **Hole Tolerance**: {hole_upper*1000:+.1f}μm / {hole_lower*1000:+.1f}μm
+- **Shaft Tolerance**: {shaft_upper*1000:+.1f}μm / {shaft_lower*1000:+.1f}μm
+- **Fundamental Deviation**: hole {min(hole_upper, hole_lower, key=abs)*1000:+.1f}μm, shaft {min(shaft_upper, shaft_lower, key=abs)*1000:+.1f}μm
 
 ## Fit Analysis
 - **Maximum Clearance**: {max_clearance*1000:.1f}μm
@@ -576,25 +597,25 @@ def calculate_fit_and_tolerance(
 - **Measurement**: Use coordinate measuring machine (CMM)
 - **Assembly**: {"Press fit" if fit_type == "interference" else "Sliding fit"}
 
-"""
+"""]
         
         if warnings:
-            report += "## Warnings\n"
+            parts.append("## Warnings\n")
             for warning in warnings:
-                report += f"- ⚠️ {warning}\n"
+                parts.append(f"- ⚠️ {warning}\n")
         
         # Add process recommendations
-        report += "\n## Process Recommendations\n"
+        parts.append("\n## Process Recommendations\n")
         if nominal_dimension < 6:
-            report += "- Small diameter - consider wire EDM for precision\n"
+            parts.append("- Small diameter - consider wire EDM for precision\n")
         elif nominal_dimension > 100:
-            report += "- Large diameter - verify machine capacity\n"
+            parts.append("- Large diameter - verify machine capacity\n")
         
         if fit_type == "interference":
-            report += "- Consider hydraulic or thermal assembly methods\n"
-            report += "- Verify material stress limits\n"
+            parts.append("- Consider hydraulic or thermal assembly methods\n")
+            parts.append("- Verify material stress limits\n")
         
-        return [TextContent(type="text", text=report)]
+        return [TextContent(type="text", text="".join(parts))]
         
     except Exception as e:
         logger.error(f"Fit and tolerance calculation failed: {e}")
@@ -633,8 +654,7 @@ def validate_design_comprehensive(
             validation_options = {}
         
         # Get objects from FreeCAD
-        freecad = get_freecad_connection()
-        objects_data = freecad.get_objects(doc_name)
+        objects_data = _get_objects(doc_name)
         
         # Convert FreeCAD data to validation format
         validation_data = {
@@ -702,23 +722,23 @@ def validate_design_comprehensive(
         validation_result = validation_system.validate_design(validation_data, validation_options)
         
         # Generate detailed report
-        detailed_report = validation_system.generate_validation_report(validation_result)
+        parts = [validation_system.generate_validation_report(validation_result)]
         
         # Add FreeCAD-specific recommendations
-        detailed_report += f"\n## FreeCAD Integration Recommendations\n"
+        parts.append(f"\n## FreeCAD Integration Recommendations\n")
         
         if validation_result.overall_score < 70:
-            detailed_report += "- Run FEA analysis using FreeCAD FEM workbench\n"
-            detailed_report += "- Use TechDraw workbench for detailed drawings\n"
+            parts.append("- Run FEA analysis using FreeCAD FEM workbench\n")
+            parts.append("- Use TechDraw workbench for detailed drawings\n")
         
         if validation_result.issues_by_category.get("manufacturing", 0) > 2:
-            detailed_report += "- Export to CAM workbench for toolpath generation\n"
-            detailed_report += "- Verify with manufacturing DFM checks\n"
+            parts.append("- Export to CAM workbench for toolpath generation\n")
+            parts.append("- Verify with manufacturing DFM checks\n")
         
-        detailed_report += f"- Consider exporting to STEP format for external validation\n"
+        parts.append(f"- Consider exporting to STEP format for external validation\n")
         
         logger.info(f"Design validation completed: {validation_result.overall_score:.1f}/100")
-        return [TextContent(type="text", text=detailed_report)]
+        return [TextContent(type="text", text="".join(parts))]
         
     except Exception as e:
         logger.error(f"Comprehensive design validation failed: {e}")
@@ -749,17 +769,16 @@ def optimize_for_manufacturing(
             optimization_goals = ["cost", "time"]
         
         # Get current design state
-        freecad = get_freecad_connection()
-        objects_data = freecad.get_objects(doc_name)
+        objects_data = _get_objects(doc_name)
         
         # Analyze current design for optimization opportunities
-        optimization_report = f"""# Manufacturing Optimization Report
+        parts = [f"""# Manufacturing Optimization Report
 
 ## Target Process: {process.replace('_', ' ').title()}
 ## Optimization Goals: {', '.join(optimization_goals)}
 
 ## Current Design Analysis
-"""
+"""]
         
         total_volume = 0
         optimization_opportunities = []
@@ -769,7 +788,7 @@ def optimize_for_manufacturing(
             volume = obj.get("Volume", 0)
             total_volume += volume
             
-            optimization_report += f"- **{obj_name}**: Volume {volume:.0f} mm³\n"
+            parts.append(f"- **{obj_name}**: Volume {volume:.0f} mm³\n")
         
         # Process-specific optimizations
         if process == "cnc_machining":
@@ -839,55 +858,71 @@ def optimize_for_manufacturing(
             ])
         
         # Generate optimization recommendations
-        optimization_report += "\n## Optimization Opportunities\n"
+        parts.append("\n## Optimization Opportunities\n")
         
         for i, opp in enumerate(optimization_opportunities, 1):
-            optimization_report += f"\n### {i}. {opp['category']}\n"
-            optimization_report += f"**Recommendation**: {opp['description']}\n"
-            optimization_report += f"**Impact**: {opp['impact']}\n"
-            optimization_report += f"**Potential Savings**: {opp['cost_saving']}\n"
+            parts.append(f"\n### {i}. {opp['category']}\n")
+            parts.append(f"**Recommendation**: {opp['description']}\n")
+            parts.append(f"**Impact**: {opp['impact']}\n")
+            parts.append(f"**Potential Savings**: {opp['cost_saving']}\n")
         
         # Goal-specific recommendations
-        optimization_report += "\n## Goal-Specific Recommendations\n"
+        parts.append("\n## Goal-Specific Recommendations\n")
         
         if "cost" in optimization_goals:
-            optimization_report += "### Cost Optimization\n"
-            optimization_report += "- Use standard tool sizes and materials\n"
-            optimization_report += "- Minimize tolerance requirements where possible\n"
-            optimization_report += "- Consider material substitution analysis\n"
+            parts.append("### Cost Optimization\n")
+            parts.append("- Use standard tool sizes and materials\n")
+            parts.append("- Minimize tolerance requirements where possible\n")
+            parts.append("- Consider material substitution analysis\n")
         
         if "time" in optimization_goals:
-            optimization_report += "### Time Optimization\n"
-            optimization_report += "- Optimize part orientation for minimal setup\n"
-            optimization_report += "- Use larger corner radii for faster machining\n"
-            optimization_report += "- Combine similar features for batch processing\n"
+            parts.append("### Time Optimization\n")
+            parts.append("- Optimize part orientation for minimal setup\n")
+            parts.append("- Use larger corner radii for faster machining\n")
+            parts.append("- Combine similar features for batch processing\n")
         
         if "quality" in optimization_goals:
-            optimization_report += "### Quality Optimization\n"
-            optimization_report += "- Add stress-relief features at transitions\n"
-            optimization_report += "- Specify appropriate surface finish requirements\n"
-            optimization_report += "- Consider inspection accessibility\n"
+            parts.append("### Quality Optimization\n")
+            parts.append("- Add stress-relief features at transitions\n")
+            parts.append("- Specify appropriate surface finish requirements\n")
+            parts.append("- Consider inspection accessibility\n")
         
         if "material_usage" in optimization_goals:
-            optimization_report += "### Material Optimization\n"
-            optimization_report += "- Topology optimization for load paths\n"
-            optimization_report += "- Hollow non-structural sections\n"
-            optimization_report += "- Optimize material distribution\n"
+            parts.append("### Material Optimization\n")
+            parts.append("- Topology optimization for load paths\n")
+            parts.append("- Hollow non-structural sections\n")
+            parts.append("- Optimize material distribution\n")
         
         # Implementation steps
-        optimization_report += "\n## Implementation Steps\n"
-        optimization_report += "1. Review and prioritize optimization opportunities\n"
-        optimization_report += "2. Modify CAD model with recommended changes\n"
-        optimization_report += "3. Re-run DFM analysis to verify improvements\n"
-        optimization_report += "4. Generate updated manufacturing drawings\n"
-        optimization_report += "5. Validate with manufacturing partner\n"
+        parts.append("\n## Implementation Steps\n")
+        parts.append("1. Review and prioritize optimization opportunities\n")
+        parts.append("2. Modify CAD model with recommended changes\n")
+        parts.append("3. Re-run DFM analysis to verify improvements\n")
+        parts.append("4. Generate updated manufacturing drawings\n")
+        parts.append("5. Validate with manufacturing partner\n")
         
-        return [TextContent(type="text", text=optimization_report)]
+        return [TextContent(type="text", text="".join(parts))]
         
     except Exception as e:
         logger.error(f"Manufacturing optimization failed: {e}")
         return [TextContent(type="text", text=f"Manufacturing optimization failed: {e}")]
 
+@enhanced_mcp.tool()
+def clear_object_cache(ctx: Context) -> List[TextContent]:
+    """
+    Drop all cached FreeCAD object lists so the next analysis re-reads every document.
+    
+    The analysis tools reuse a document's objects for a few seconds to skip the
+    FreeCAD round-trip, holding up to 32 object lists in memory. Changes made
+    through the FreeCAD connection invalidate them automatically; use this after
+    editing a document directly in the FreeCAD GUI.
+    
+    Returns:
+        Confirmation that the cache was cleared
+    """
+    _get_objects_cached.cache_clear()
+    return [TextContent(type="text", text="FreeCAD object cache cleared")]
+
 # Enhanced prompts
 @enhanced_mcp.prompt()
 def manufacturing_design_guidelines() -> str:
@@ -5,6 +5,8 @@ Provides physics-based spatial layout with collision detection, ergonomic analys
 
 import math
 import logging
+import random
+from operator import mul
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -101,6 +103,29 @@ class SpatialObject:
             min_z=z - d/2, max_z=z + d/2
         )
 
+def _box_distance(position1: Tuple[float, float, float], dimensions1: Tuple[float, float, float],
+                  position2: Tuple[float, float, float], dimensions2: Tuple[float, float, float]) -> float:
+    """BoundingBox.distance_to for two centred boxes, without building the boxes"""
+    x1, y1, z1 = position1
+    w1, h1, d1 = dimensions1
+    x2, y2, z2 = position2
+    w2, h2, d2 = dimensions2
+    dx = max(0, max((x1 - w1/2) - (x2 + w2/2), (x2 - w2/2) - (x1 + w1/2)))
+    dy = max(0, max((y1 - h1/2) - (y2 + h2/2), (y2 - h2/2) - (y1 + h1/2)))
+    dz = max(0, max((z1 - d1/2) - (z2 + d2/2), (z2 - d2/2) - (z1 + d1/2)))
+    return math.sqrt(dx*dx + dy*dy + dz*dz)
+
+def _box_intersects(position: Tuple[float, float, float], dimensions: Tuple[float, float, float],
+                    box: Tuple[float, float, float, float, float, float]) -> bool:
+    """BoundingBox.intersects for a centred box against (min_x, min_y, min_z, max_x, max_y, max_z)"""
+    x, y, z = position
+    w, h, d = dimensions
+    return (
+        x - w/2 <= box[3] and x + w/2 >= box[0] and
+        y - h/2 <= box[4] and y + h/2 >= box[1] and
+        z - d/2 <= box[5] and z + d/2 >= box[2]
+    )
+
 @dataclass
 class SpatialConstraint:
     """Constraint between spatial objects"""
@@ -124,6 +149,52 @@ class SpatialConstraint:
         else:
             return {"satisfied": True, "violation": 0.0, "details": "Unknown constraint type"}
     
+    def violation(self, objects: Dict[str, SpatialObject]) -> float:
+        """The violation evaluate() would report, computed without building its details
+        
+        Works on the raw positions and dimensions, so scoring a layout allocates no
+        bounding boxes or detail strings.
+        """
+        constraint_type = self.constraint_type
+        
+        if constraint_type == ConstraintType.CLEARANCE:
+            if len(self.objects) < 2:
+                return 0.0
+            obj1, obj2 = objects[self.objects[0]], objects[self.objects[1]]
+            actual_distance = _box_distance(obj1.position, obj1.dimensions, obj2.position, obj2.dimensions)
+            return max(0, self.parameters.get("min_distance", 5.0) - actual_distance)
+        
+        elif constraint_type == ConstraintType.ACCESSIBILITY:
+            target_name = self.objects[0]
+            x, y, z = objects[target_name].position
+            w, h, d = objects[target_name].dimensions
+            access_distance = self.parameters.get("distance", 50.0)
+            
+            if self.parameters.get("direction", "top") == "front":
+                zone = (x-w/2, y+h/2, z-d/2, x+w/2, y+h/2+access_distance, z+d/2)
+            else:
+                zone = (x-w/2, y-h/2, z+d/2, x+w/2, y+h/2, z+d/2+access_distance)
+            
+            return sum(1 for name, obj in objects.items()
+                       if name != target_name and _box_intersects(obj.position, obj.dimensions, zone))
+        
+        elif constraint_type == ConstraintType.THERMAL:
+            if len(self.objects) < 2:
+                return 0.0
+            heat_source = objects[self.objects[0]]
+            sensitive_obj = objects[self.objects[1]]
+            distance = _box_distance(heat_source.position, heat_source.dimensions,
+                                     sensitive_obj.position, sensitive_obj.dimensions)
+            heat_gen = heat_source.thermal_properties.get("heat_generation", 0.0)
+            temp_rise = heat_gen / max(1.0, distance ** 2) * 100
+            return max(0, temp_rise - self.parameters.get("max_temp_rise", 20.0))
+        
+        elif constraint_type in (ConstraintType.GRAVITY, ConstraintType.ERGONOMIC):
+            # Already plain arithmetic on one object
+            return self.evaluate(objects)["violation"]
+        
+        return 0.0
+    
     def _evaluate_clearance(self, objects: Dict[str, SpatialObject]) -> Dict[str, Any]:
         """Evaluate clearance constraint"""
         if len(self.objects) < 2:
@@ -380,27 +451,36 @@ class EnhancedSpatialFramework:
             best_score = initial_eval["overall_score"]
             best_positions = {name: obj.position for name, obj in self.objects.items()}
             
+            # Constraint weights and current scores as parallel columns; a move only
+            # re-scores the constraints it can change
+            constraints = self.constraints
+            weights = [constraint.priority for constraint in constraints]
+            total_weight = max(1, sum(weights))
+            scores = [self._constraint_score(constraint) for constraint in constraints]
+            
+            # Any object can obstruct an access zone, so accessibility is re-scored on every move
+            affected_by = {
+                name: [k for k, constraint in enumerate(constraints)
+                       if name in constraint.objects or constraint.constraint_type == ConstraintType.ACCESSIBILITY]
+                for name in self.objects
+            }
+            movable = [(name, obj) for name, obj in self.objects.items() if not obj.fixed]
+            
             for iteration in range(max_iterations):
                 # Try to improve layout by adjusting object positions
                 improved = False
                 
-                for obj_name, obj in self.objects.items():
-                    if obj.fixed:
-                        continue
-                    
+                for obj_name, obj in movable:
                     # Try small random adjustments
                     original_pos = obj.position
+                    affected = affected_by[obj_name]
                     
                     for _ in range(10):  # Try 10 random adjustments per object
                         # Generate small random displacement
-                        dx = (math.random() - 0.5) * 20  # ±10mm
-                        dy = (math.random() - 0.5) * 20
-                        dz = (math.random() - 0.5) * 10  # Smaller Z adjustment
-                        
                         new_pos = (
-                            original_pos[0] + dx,
-                            original_pos[1] + dy,
-                            original_pos[2] + dz
+                            original_pos[0] + random.uniform(-10, 10),  # ±10mm
+                            original_pos[1] + random.uniform(-10, 10),
+                            original_pos[2] + random.uniform(-5, 5)     # Smaller Z adjustment
                         )
                         
                         # Check if new position is within bounds
@@ -409,11 +489,15 @@ class EnhancedSpatialFramework:
                             obj.position = original_pos
                             continue
                         
-                        # Evaluate new layout
-                        eval_result = self.evaluate_layout()
+                        # Score the new layout, re-evaluating only the affected constraints
+                        trial_scores = list(scores)
+                        for k in affected:
+                            trial_scores[k] = self._constraint_score(constraints[k])
+                        trial_score = sum(map(mul, weights, trial_scores)) / total_weight
                         
-                        if eval_result["overall_score"] > best_score:
-                            best_score = eval_result["overall_score"]
+                        if trial_score > best_score:
+                            best_score = trial_score
+                            scores = trial_scores
                             best_positions[obj_name] = new_pos
                             improved = True
                             
@@ -422,7 +506,7 @@ class EnhancedSpatialFramework:
                                 "object": obj_name,
                                 "old_position": original_pos,
                                 "new_position": new_pos,
-                                "score_improvement": eval_result["overall_score"] - optimization_results["initial_score"]
+                                "score_improvement": trial_score - optimization_results["initial_score"]
                             })
                             break
                         else:
@@ -449,37 +533,43 @@ class EnhancedSpatialFramework:
         
         return optimization_results
     
+    def _constraint_score(self, constraint: SpatialConstraint) -> float:
+        """Score (0-100) of one constraint in the current layout, as used by evaluate_layout"""
+        violation = constraint.violation(self.objects)
+        return 100 if violation == 0 else max(0, 100 - violation * 10)
+    
     def detect_collisions(self) -> List[Dict[str, Any]]:
         """Detect collisions between objects"""
         collisions = []
         
         try:
             object_names = list(self.objects.keys())
+            boxes = [obj.bounding_box for obj in self.objects.values()]
             
-            for i in range(len(object_names)):
-                for j in range(i + 1, len(object_names)):
+            # Only pairs that survive the broad phase get the exact overlap test
+            for i, j in self._broadphase_pairs(boxes):
+                bbox1, bbox2 = boxes[i], boxes[j]
+                
+                if bbox1.intersects(bbox2):
                     obj1_name = object_names[i]
                     obj2_name = object_names[j]
                     obj1 = self.objects[obj1_name]
                     obj2 = self.objects[obj2_name]
                     
-                    if obj1.bounding_box.intersects(obj2.bounding_box):
-                        # Calculate overlap volume
-                        bbox1, bbox2 = obj1.bounding_box, obj2.bounding_box
-                        
-                        overlap_x = min(bbox1.max_x, bbox2.max_x) - max(bbox1.min_x, bbox2.min_x)
-                        overlap_y = min(bbox1.max_y, bbox2.max_y) - max(bbox1.min_y, bbox2.min_y)
-                        overlap_z = min(bbox1.max_z, bbox2.max_z) - max(bbox1.min_z, bbox2.min_z)
-                        
-                        overlap_volume = max(0, overlap_x) * max(0, overlap_y) * max(0, overlap_z)
-                        
-                        collisions.append({
-                            "object1": obj1_name,
-                            "object2": obj2_name,
-                            "overlap_volume": overlap_volume,
-                            "severity": "critical" if overlap_volume > 1000 else "moderate",
-                            "resolution": self._suggest_collision_resolution(obj1, obj2)
-                        })
+                    # Calculate overlap volume
+                    overlap_x = min(bbox1.max_x, bbox2.max_x) - max(bbox1.min_x, bbox2.min_x)
+                    overlap_y = min(bbox1.max_y, bbox2.max_y) - max(bbox1.min_y, bbox2.min_y)
+                    overlap_z = min(bbox1.max_z, bbox2.max_z) - max(bbox1.min_z, bbox2.min_z)
+                    
+                    overlap_volume = max(0, overlap_x) * max(0, overlap_y) * max(0, overlap_z)
+                    
+                    collisions.append({
+                        "object1": obj1_name,
+                        "object2": obj2_name,
+                        "overlap_volume": overlap_volume,
+                        "severity": "critical" if overlap_volume > 1000 else "moderate",
+                        "resolution": self._suggest_collision_resolution(obj1, obj2)
+                    })
             
             logger.info(f"Collision detection complete: {len(collisions)} collisions found")
             
@@ -488,6 +578,32 @@ class EnhancedSpatialFramework:
         
         return collisions
     
+    def _broadphase_pairs(self, boxes: List[BoundingBox]) -> List[Tuple[int, int]]:
+        """Index pairs (i < j) of boxes that overlap on all three axes, in pairwise order
+        
+        Sweep and prune: boxes are visited by increasing min_x while an active list
+        keeps those whose x extent still reaches the current box, so only boxes that
+        overlap along x are compared on y and z.
+        """
+        pairs = []
+        active: List[int] = []
+        
+        for k in sorted(range(len(boxes)), key=lambda k: boxes[k].min_x):
+            box = boxes[k]
+            active = [a for a in active if boxes[a].max_x >= box.min_x]
+            
+            for a in active:
+                other = boxes[a]
+                if (other.min_y <= box.max_y and other.max_y >= box.min_y and
+                        other.min_z <= box.max_z and other.max_z >= box.min_z):
+                    pairs.append((a, k) if a < k else (k, a))
+            
+            active.append(k)
+        
+        # Report collisions in the same order as the full pairwise scan
+        pairs.sort()
+        return pairs
+    
     def _bbox_within_bounds(self, bbox: BoundingBox, bounds: BoundingBox) -> bool:
         """Check if bounding box is within specified bounds"""
         return (
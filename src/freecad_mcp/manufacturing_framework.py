@@ -9,6 +9,7 @@ manufacturing considerations.
 
 import math
 import json
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Union, Any
 from enum import Enum
@@ -316,9 +317,94 @@ class ManufacturingDatabase:
         return processes
 
 
+# ISO 286-1 nominal size steps (upper bounds, mm) and IT grade tolerances per
+# step, converted from μm to mm once at import
+_ISO_SIZE_STEPS = (3, 6, 10, 18, 30, 50, 80, 120, 180, 250, 315, 400, 500)
+_IT_TABLE: Dict[str, Tuple[float, ...]] = {
+    grade: tuple(um / 1000 for um in row)
+    for grade, row in {
+        "IT4": (3, 4, 4, 5, 6, 7, 8, 10, 12, 14, 16, 18, 20),
+        "IT5": (4, 5, 6, 8, 9, 11, 13, 15, 18, 20, 23, 25, 27),
+        "IT6": (6, 8, 9, 11, 13, 16, 19, 22, 25, 29, 32, 36, 40),
+        "IT7": (10, 12, 15, 18, 21, 25, 30, 35, 40, 46, 52, 57, 63),
+        "IT8": (14, 18, 22, 27, 33, 39, 46, 54, 63, 72, 81, 89, 97),
+        "IT9": (25, 30, 36, 43, 52, 62, 74, 87, 100, 115, 130, 140, 155),
+        "IT10": (40, 48, 58, 70, 84, 100, 120, 140, 160, 185, 210, 230, 250),
+        "IT11": (60, 75, 90, 110, 130, 160, 190, 220, 250, 290, 320, 360, 400),
+    }.items()
+}
+
+# ISO 286-1 shaft fundamental deviations per size step, μm to mm: the upper
+# deviation es for d-h and the lower deviation ei for k-p (k as for IT4-IT7)
+_SHAFT_DEVIATIONS: Dict[str, Tuple[float, ...]] = {
+    letter: tuple(um / 1000 for um in row)
+    for letter, row in {
+        "d": (-20, -30, -40, -50, -65, -80, -100, -120, -145, -170, -190, -210, -230),
+        "e": (-14, -20, -25, -32, -40, -50, -60, -72, -85, -100, -110, -125, -135),
+        "f": (-6, -10, -13, -16, -20, -25, -30, -36, -43, -50, -56, -62, -68),
+        "g": (-2, -4, -5, -6, -7, -9, -10, -12, -14, -15, -17, -18, -20),
+        "h": (0,) * 13,
+        "k": (0, 1, 1, 1, 2, 2, 2, 3, 3, 4, 4, 4, 5),
+        "m": (2, 4, 6, 7, 8, 9, 11, 13, 15, 17, 20, 21, 23),
+        "n": (4, 8, 10, 12, 15, 17, 20, 23, 27, 31, 34, 37, 40),
+        "p": (6, 12, 15, 18, 22, 26, 32, 37, 43, 50, 56, 62, 68),
+    }.items()
+}
+
+
 class ToleranceCalculator:
     """Calculate tolerances and fits for manufacturing"""
     
+    @staticmethod
+    def iso_size_step(nominal_size: float) -> int:
+        """Index of the ISO 286-1 size step containing a nominal size; sizes past 500mm use the last step"""
+        return min(bisect_left(_ISO_SIZE_STEPS, nominal_size), len(_ISO_SIZE_STEPS) - 1)
+    
+    @staticmethod
+    def fit_deviations(tolerance_grade: str, size_step: int) -> Tuple[float, float]:
+        """Upper and lower deviations in mm for a fit such as "H7" or "g6" at a size step
+        
+        Supports ISO 286-1 hole positions D-H, JS, K-P and shaft positions d-h,
+        js, k-p. K beyond IT8 is not standardised above 3mm and is rejected.
+        """
+        letters = tolerance_grade.rstrip("0123456789")
+        digits = tolerance_grade[len(letters):]
+        row = _IT_TABLE.get(f"IT{digits}")
+        position = letters.lower()
+        if (row is None or letters not in (position, position.upper())
+                or (position not in _SHAFT_DEVIATIONS and position != "js")):
+            raise ValueError(f"Unsupported tolerance grade: {tolerance_grade}")
+        tolerance = row[size_step]
+        grade = int(digits)
+        
+        if position == "js":
+            return tolerance / 2, -tolerance / 2
+        deviation = _SHAFT_DEVIATIONS[position][size_step]
+        
+        if letters.islower():
+            if letters == "k" and not 4 <= grade <= 7:
+                deviation = 0.0
+            if letters <= "h":
+                return deviation, deviation - tolerance
+            return deviation + tolerance, deviation
+        
+        # Holes mirror the shaft deviation: EI = -es for D-H and ES = -ei for K-P
+        if letters <= "H":
+            return tolerance - deviation, -deviation
+        if letters == "K" and grade > 8:
+            raise ValueError(f"Unsupported tolerance grade: {tolerance_grade}")
+        if grade <= (7 if letters == "P" else 8):
+            # Fine grades add Δ = IT(n) - IT(n-1), which is zero up to 3mm
+            previous = _IT_TABLE.get(f"IT{grade - 1}")
+            if previous is None:
+                raise ValueError(f"Unsupported tolerance grade: {tolerance_grade}")
+            upper = -deviation + (tolerance - previous[size_step] if size_step else 0.0)
+        elif letters == "N" and size_step:
+            upper = 0.0
+        else:
+            upper = -deviation
+        return upper, upper - tolerance
+    
     @staticmethod
     def calculate_tolerance(nominal_size: float, grade: ToleranceGrade) -> float:
         """Calculate tolerance for given nominal size and grade"""
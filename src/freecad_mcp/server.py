@@ -17,16 +17,25 @@ logger = logging.getLogger("TaiyakiAI")
 
 
 class FreeCADConnection:
+    # Bumped before every call that may modify a FreeCAD document. Shared by all
+    # connections, so callers caching document reads can tell when they are stale.
+    revision = 0
+
     def __init__(self, host: str = "localhost", port: int = 9875):
         self.server = xmlrpc.client.ServerProxy(f"http://{host}:{port}", allow_none=True)
 
+    def _modifying(self) -> None:
+        FreeCADConnection.revision += 1
+
     def ping(self) -> bool:
         return self.server.ping()
 
     def create_document(self, name: str) -> dict[str, Any]:
+        self._modifying()
         return self.server.create_document(name)
         
     def create_parametric_model(self, doc_name: str, model_type: str, parameters: dict[str, Any]) -> dict[str, Any]:
+        self._modifying()
         return self.server.create_parametric_model(doc_name, model_type, parameters)
         
     def export_step(self, doc_name: str, file_path: str, object_names: list = None) -> dict[str, Any]:
@@ -51,20 +60,25 @@ class FreeCADConnection:
             if "Analysis" not in obj_data:
                 obj_data["Analysis"] = None
                 
+            self._modifying()
             return self.server.create_object(doc_name, json.dumps(obj_data))
         except Exception as e:
             return {"success": False, "error": f"Data validation failed: {str(e)}"}
 
     def edit_object(self, doc_name: str, obj_name: str, obj_data: dict[str, Any]) -> dict[str, Any]:
+        self._modifying()
         return self.server.edit_object(doc_name, obj_name, json.dumps(obj_data))
 
     def delete_object(self, doc_name: str, obj_name: str) -> dict[str, Any]:
+        self._modifying()
         return self.server.delete_object(doc_name, obj_name)
 
     def insert_part_from_library(self, relative_path: str) -> dict[str, Any]:
+        self._modifying()
         return self.server.insert_part_from_library(relative_path)
 
     def execute_code(self, code: str) -> dict[str, Any]:
+        self._modifying()
         return self.server.execute_code(code)
 
     def get_active_screenshot(self, view_name: str = "Isometric") -> str:
@@ -80,21 +94,26 @@ class FreeCADConnection:
         return self.server.get_parts_list()
 
     def run_cnc_manufacturing_dfm_check(self, doc_name: str, params: Dict[str, float]) -> dict[str, Any]:
+        self._modifying()
         return self.server.run_cnc_manufacturing_dfm_check(doc_name, json.dumps(params or {}))
     
     def import_step_file(self, doc_name: str, file_path: str) -> dict[str, Any]:
         """Import a STEP file into the specified FreeCAD document."""
         try:
+            self._modifying()
             return self.server.import_step_file(doc_name, file_path)
         except Exception as e:
             return {"success": False, "error": f"Failed to import STEP file: {str(e)}"}
     def run_3d_printing_dfm_check(self, doc_name: str, params: Dict[str, float]) -> dict[str, Any]:
+        self._modifying()
         return self.server.run_3d_printing_dfm_check(doc_name, json.dumps(params or {}))
     
     def run_injection_molding_dfm_check(self, doc_name: str, params: Dict[str, float]) -> dict[str, Any]:
+        self._modifying()
         return self.server.run_injection_molding_dfm_check(doc_name, json.dumps(params or {}))
     
     def restore_colors_after_check(self, doc_name: str) -> dict[str, Any]:
+        self._modifying()
         return self.server.restore_colors_after_check(doc_name)
 
 
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the advanced CAD operations
+"""
+
+import sys
+import os
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from freecad_mcp.advanced_cad_operations import (
+    AdvancedCADOperations, ParametricExpression, SketchConstraint, _compile_expression
+)
+
+
+def test_batch_create_holes_matches_single_hole_features():
+    """Batched holes equal holes created one at a time with the same values"""
+    single = AdvancedCADOperations()
+    batched = AdvancedCADOperations()
+    holes = [("h1", (0, 0, 0), 2.0, 30.0), ("h2", (5, 5, 0), 4.0, 8.0)]
+    for name, position, diameter, depth in holes:
+        assert single.create_hole_feature(name, position, diameter, depth, "precision")
+
+    assert batched.batch_create_holes(*map(list, zip(*holes)), hole_type="precision")
+    assert batched.feature_tree == single.feature_tree == ["h1", "h2"]
+    for name, _, _, _ in holes:
+        assert batched.features[name] == single.features[name]
+    assert batched.generate_manufacturing_report() == single.generate_manufacturing_report()
+
+
+def test_batch_create_holes_rejects_bad_batches_without_adding_holes():
+    """Mismatched lengths and zero diameters add nothing"""
+    ops = AdvancedCADOperations()
+    assert not ops.batch_create_holes(["a", "b"], [(0, 0, 0)], [1.0, 1.0], [2.0, 2.0])
+    assert not ops.batch_create_holes(["a", "b"], [(0, 0, 0)] * 2, [1.0, 0.0], [2.0, 2.0])
+    assert ops.features == {} and ops.feature_tree == []
+
+
+def test_add_sketch_polyline_adds_connected_lines():
+    """Each consecutive pair of points becomes one line with its length"""
+    ops = AdvancedCADOperations()
+    ops.create_parametric_sketch("s")
+    assert ops.add_sketch_polyline("s", [(0, 0), (3, 4), (3, 0)])
+    assert ops.add_sketch_polyline("s", [(0, 0), (1, 0)], names=["Base"])
+
+    elements = ops.sketches["s"].elements
+    assert [e.element_type for e in elements] == ["line"] * 3
+    assert [e.points for e in elements] == [[(0, 0), (3, 4)], [(3, 4), (3, 0)], [(0, 0), (1, 0)]]
+    assert [e.parameters for e in elements] == [
+        {"name": "Line_0", "length": 5.0},
+        {"name": "Line_1", "length": 4.0},
+        {"name": "Base", "length": 1.0}
+    ]
+    assert not ops.add_sketch_polyline("missing", [(0, 0), (1, 1)])
+
+
+def test_equal_constraints_are_shared_within_one_model_only():
+    """Constraint interning is scoped to the model that added them"""
+    first = AdvancedCADOperations()
+    second = AdvancedCADOperations()
+    for ops in (first, second):
+        ops.create_parametric_sketch("a")
+        ops.create_parametric_sketch("b")
+        for sketch in ("a", "b"):
+            assert ops.add_sketch_constraint(sketch, SketchConstraint("distance", ["L0", "L1"], 5.0))
+
+    assert first.sketches["a"].constraints[0] is first.sketches["b"].constraints[0]
+    assert first.sketches["a"].constraints[0] == second.sketches["a"].constraints[0]
+    assert first.sketches["a"].constraints[0] is not second.sketches["a"].constraints[0]
+
+
+def test_fillet_dependencies_follow_existing_features():
+    """Edge references resolve to features that exist when the fillet is created"""
+    ops = AdvancedCADOperations()
+    edges = ["h1.Edge1", "h2.Edge3", "Loose"]
+    assert ops.create_hole_feature("h1", (0, 0, 0), 2.0, 4.0)
+    assert ops.create_fillet_feature("f1", edges, 0.5)
+    assert ops.features["f1"].dependencies == ["h1"]
+
+    # The same edges pick up a feature created since the last fillet
+    assert ops.create_hole_feature("h2", (5, 0, 0), 2.0, 4.0)
+    assert ops.create_fillet_feature("f2", edges, 0.5)
+    assert ops.features["f2"].dependencies == ["h1", "h2"]
+    assert ops.features["f1"].dependencies == ["h1"]
+
+
+def test_compiled_expressions_are_bounded():
+    """Distinct expression strings do not grow the compile cache past its limit"""
+    limit = _compile_expression.cache_info().maxsize
+    for i in range(limit + 50):
+        assert ParametricExpression(f"width * {i}", {"width": 2.0}).evaluate() == 2.0 * i
+    assert _compile_expression.cache_info().currsize == limit
+
+
+def test_update_picks_up_direct_global_variable_edits():
+    """Editing global_variables directly re-evaluates the features that use it"""
+    ops = AdvancedCADOperations()
+    assert ops.set_global_variable("d", 2.0)
+    assert ops.set_global_variable("depth", 4.0)
+    assert ops.create_hole_feature("h1", (0, 0, 0), "d", "depth")
+    assert ops.create_hole_feature("h2", (5, 0, 0), 3.0, "depth")
+    assert ops.update_parametric_model()["updated_features"] == ["h1", "h2"]
+
+    ops.global_variables["d"] = 5.0
+    assert ops.update_parametric_model()["updated_features"] == ["h1"]
+    assert ops.features["h1"].parameters["diameter"] == 5.0
+
+    # Unchanged variables leave every feature alone
+    assert ops.update_parametric_model()["updated_features"] == []
+    ops.set_global_variable("depth", 6.0)
+    assert ops.update_parametric_model()["updated_features"] == ["h1", "h2"]
+    assert ops.features["h2"].parameters["depth"] == 6.0
+
+
+def test_updated_hole_reports_current_geometry():
+    """Manufacturing notes follow re-evaluated hole dimensions"""
+    ops = AdvancedCADOperations()
+    ops.set_global_variable("depth", 4.0)
+    assert ops.create_hole_feature("h1", (0, 0, 0), 2.0, "depth")
+    assert "Aspect ratio: 2.00" in ops.generate_manufacturing_report()
+
+    ops.set_global_variable("depth", 20.0)
+    ops.update_parametric_model()
+    deep = AdvancedCADOperations()
+    assert deep.create_hole_feature("h1", (0, 0, 0), 2.0, 20.0)
+    assert ops.features["h1"].manufacturing_notes == deep.features["h1"].manufacturing_notes
+    report = ops.generate_manufacturing_report()
+    assert "Aspect ratio: 10.00" in report
+    assert "stepped drilling for 1 high aspect ratio holes" in report
+
+    ops.set_global_variable("depth", 4.0)
+    ops.update_parametric_model()
+    report = ops.generate_manufacturing_report()
+    assert "Aspect ratio: 2.00" in report and "High Aspect Ratio Hole" not in report
+    assert "stepped drilling" not in report
+
+
+def test_export_feature_tree_returns_independent_copies():
+    """Changing one export affects neither the model nor later exports"""
+    ops = AdvancedCADOperations()
+    ops.set_global_variable("d", 2.0)
+    assert ops.create_hole_feature("h1", (0, 0, 0), "d", 4.0)
+    first = ops.export_feature_tree()
+    first["features"]["h1"]["parameters"]["diameter"] = 99.0
+    first["global_variables"]["d"] = 99.0
+    first["feature_order"].append("bogus")
+
+    second = ops.export_feature_tree()
+    assert second["features"]["h1"]["parameters"]["diameter"] == 2.0
+    assert second["global_variables"] == {"d": 2.0}
+    assert second["feature_order"] == ["h1"]
+    assert ops.features["h1"].parameters["diameter"] == 2.0
+
+    # Direct variable edits are not served from a stale export
+    ops.global_variables["d"] = 3.0
+    assert ops.export_feature_tree()["global_variables"] == {"d": 3.0}
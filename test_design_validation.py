@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Tests for the design validation system
+"""
+
+import io
+import json
+import sys
+import os
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from freecad_mcp.design_validation_system import (
+    DesignValidationSystem, GeometryArrays, GeometryValidator, ManufacturingValidator,
+    ValidationCategory, ValidationSeverity, create_mock_design_data
+)
+
+
+def _titles(issues):
+    return sorted(issue.title for issue in issues)
+
+
+def test_malformed_feature_does_not_blank_other_geometry_checks():
+    """A feature with a non-numeric size only drops that feature"""
+    objects = create_mock_design_data()["objects"]
+    objects["housing"]["features"] = [
+        {"type": "rib", "size": None},
+        {"type": "boss", "size": 0.1, "location": (0, 0, 5)}
+    ]
+    validator = GeometryValidator()
+
+    arrays = GeometryArrays.from_objects(objects)
+    assert list(arrays.feature_size) == [0.1]
+    assert len(arrays.face_thickness) == 2
+    assert len(arrays.hole_diameter) == 2
+
+    assert _titles(validator.validate_wall_thickness(objects)) == ["Insufficient Wall Thickness"]
+    assert _titles(validator.validate_feature_sizes(objects)) == ["Feature Too Small"]
+    assert _titles(validator.validate_hole_geometry(objects)) == ["Small Hole Diameter"]
+
+    system = DesignValidationSystem()
+    titles = _titles(system.validate_design({"objects": objects}).issues)
+    assert "Insufficient Wall Thickness" in titles
+    assert "Small Hole Diameter" in titles
+    assert "Feature Too Small" in titles
+
+
+def test_malformed_rows_and_objects_are_skipped():
+    """Non-dict rows, non-list row containers and non-dict objects are skipped"""
+    objects = {
+        "bad": None,
+        "odd": {"faces": "thin", "holes": [None, {"diameter": "0.5", "depth": 2}]},
+        "ok": {"faces": [{"thickness": 0.5}]}
+    }
+    arrays = GeometryArrays.from_objects(objects)
+    assert arrays.names == ["bad", "odd", "ok"]
+    assert list(arrays.hole_diameter) == [0.5]
+    assert [arrays.names[i] for i in arrays.face_owner] == ["ok"]
+
+
+def test_repeated_validation_returns_independent_results():
+    """Each validate_design call builds its own result"""
+    system = DesignValidationSystem()
+    design = create_mock_design_data()
+    first = system.validate_design(design)
+    second = system.validate_design(design)
+    assert first is not second
+    assert second.timestamp >= first.timestamp
+    first.issues.clear()
+    assert second.total_issues == len(second.issues) > 0
+
+
+def test_process_limits_keep_dict_style_access():
+    """processes[name][key] reads and writes the typed process limits"""
+    validator = ManufacturingValidator()
+    fdm = validator.processes["fdm_3d_printing"]
+    assert fdm["min_wall_thickness"] == 1.2
+    assert dict(validator.processes["cnc_machining"]) == {
+        "min_wall_thickness": 0.5, "min_feature_size": 0.1,
+        "min_corner_radius": 0.1, "max_aspect_ratio": 10
+    }
+    assert "max_overhang_angle" in fdm and "min_draft_angle" not in fdm
+    try:
+        fdm["unknown"]
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("unknown limit did not raise KeyError")
+
+    objects = {"part": {"overhangs": [{"angle": 40, "location": (0, 0, 0)}]}}
+    assert validator.validate_for_process(objects, "fdm_3d_printing") == []
+    fdm["max_overhang_angle"] = 30
+    assert fdm.max_overhang_angle == 30
+    assert _titles(validator.validate_for_process(objects, "fdm_3d_printing")) == ["Unsupported Overhang"]
+
+    # Limits replaced wholesale with a plain dict, as before the typed parameters
+    validator.processes["fdm_3d_printing"] = {
+        "min_wall_thickness": 1.2, "min_feature_size": 0.8,
+        "max_overhang_angle": 50, "min_clearance": 0.4
+    }
+    assert validator.validate_for_process(objects, "fdm_3d_printing") == []
+
+
+def _busy_design():
+    """Mock design with issues in every enabled category"""
+    design = create_mock_design_data()
+    housing = design["objects"]["housing"]
+    housing["features"] = [{"type": "rib", "size": 0.1, "location": (0, 0, 1)}]
+    housing["internal_corners"] = [{"radius": 0.05, "location": (1, 1, 0)}]
+    design["objects"]["bracket"] = {
+        "material": "titanium",
+        "volume": 2000.0,
+        "faces": [{"thickness": 0.2, "center": (0, 0, 0)}],
+        "pockets": [{"depth": 30, "width": 2, "location": (0, 0, 0)}],
+        "stress_concentrations": [{"concentration_factor": 6.0, "location": (0, 0, 0)}]
+    }
+    design["assemblies"]["main_assembly"]["assembly_sequence"] = [
+        {"part": "bracket", "tool_access": False, "clearance": False}
+    ]
+    design["loads"]["side_load"] = {"magnitude": 50.0, "supports": []}
+    return design
+
+
+def test_iter_issues_matches_validate_design():
+    """iter_issues yields validate_design's issues in the same order"""
+    system = DesignValidationSystem()
+    design = _busy_design()
+    result = system.validate_design(design)
+    assert len({issue.category for issue in result.issues}) == 5
+    assert list(system.iter_issues(design)) == result.issues
+
+    options = {"manufacturing_process": "fdm_3d_printing", "target_cost": 1e9}
+    assert list(system.iter_issues(design, options)) == system.validate_design(design, options).issues
+
+
+def test_count_issues_matches_validate_design():
+    """count_issues agrees with issues_by_severity without building geometry issues"""
+    system = DesignValidationSystem()
+    design = _busy_design()
+    assert system.count_issues(design) == system.validate_design(design).issues_by_severity
+
+    system.enabled_categories[ValidationCategory.GEOMETRY] = False
+    system.enabled_categories[ValidationCategory.COST] = False
+    assert system.count_issues(design) == system.validate_design(design).issues_by_severity
+
+
+def test_stream_to_writes_one_json_record_per_issue():
+    """stream_to writes every issue as a JSON line and returns the summary counts"""
+    system = DesignValidationSystem()
+    design = _busy_design()
+    result = system.validate_design(design)
+    writer = io.StringIO()
+
+    summary = system.stream_to(writer, design)
+
+    records = [json.loads(line) for line in writer.getvalue().splitlines()]
+    assert len(records) == summary["total_issues"] == result.total_issues
+    for record, issue in zip(records, result.issues):
+        assert record["category"] == issue.category.value
+        assert record["severity"] == issue.severity.value
+        assert record["title"] == issue.title
+        assert record["affected_objects"] == issue.affected_objects
+        assert record["cost_impact"] == issue.cost_impact
+    assert summary["issues_by_severity"] == result.issues_by_severity
+    assert summary["issues_by_category"] == result.issues_by_category
+
+
+def test_fail_fast_stops_once_critical_issues_floor_the_score():
+    """fail_fast skips the validators after the one that drives the score to zero"""
+    system = DesignValidationSystem()
+    design = _busy_design()
+    design["loads"]["top_load"] = {"magnitude": 80.0, "supports": []}
+
+    full = system.validate_design(design)
+    fast = system.validate_design(design, {"fail_fast": True})
+
+    assert full.overall_score == fast.overall_score == 0
+    assert fast.issues == full.issues[:len(fast.issues)]
+    assert fast.issues_by_severity["critical"] >= 2
+    assert fast.issues_by_category["assembly"] == fast.issues_by_category["cost"] == 0
+    assert full.issues_by_category["assembly"] > 0 and full.issues_by_category["cost"] > 0
+
+    # Without enough critical issues every validator still runs
+    assert system.validate_design(create_mock_design_data(), {"fail_fast": True}).issues == \
+        system.validate_design(create_mock_design_data()).issues
+
+
+def test_manufacturing_cache_hits_and_isolation():
+    """validate_for_process reuses results only while inputs and limits are unchanged"""
+    validator = ManufacturingValidator(cache_size=2)
+    built = []
+    process_check = validator.process_check
+
+    def counting_process_check(process):
+        built.append(process)
+        return process_check(process)
+
+    validator.process_check = counting_process_check
+    objects = {"part": {"internal_corners": [{"radius": 0.05, "location": (0, 0, 0)}]}}
+
+    first = validator.validate_for_process(objects, "cnc_machining")
+    second = validator.validate_for_process(objects, "cnc_machining")
+    assert len(built) == 1
+    assert second == first and second is not first
+
+    # Callers mutating a result or its issues do not affect later hits
+    first[0].severity = ValidationSeverity.CRITICAL
+    first[0].description = "changed"
+    first[0].affected_objects.append("other")
+    first.clear()
+    third = validator.validate_for_process(objects, "cnc_machining")
+    assert third == second and third[0] is not second[0]
+    third[0].title = "changed"
+    hit = validator.validate_for_process(objects, "cnc_machining")
+    assert _titles(hit) == ["Sharp Internal Corner"]
+    assert hit[0].severity != ValidationSeverity.CRITICAL
+    assert hit[0].affected_objects == ["part"]
+    assert len(built) == 1
+
+    # Changed inputs or limits miss the cache
+    objects["part"]["internal_corners"][0]["radius"] = 0.5
+    assert validator.validate_for_process(objects, "cnc_machining") == []
+    validator.processes["cnc_machining"]["min_corner_radius"] = 1.0
+    assert len(validator.validate_for_process(objects, "cnc_machining")) == 1
+    assert len(built) == 3
+    assert len(validator._cache) == 2
+
+    # Designs that cannot be serialised bypass the cache
+    objects["part"]["pockets"] = [{"depth": 1, "width": 1, "location": object()}]
+    validator.validate_for_process(objects, "cnc_machining")
+    validator.validate_for_process(objects, "cnc_machining")
+    assert len(built) == 5
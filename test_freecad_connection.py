@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for FreeCAD connection bookkeeping
+"""
+
+import sys
+import os
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from freecad_mcp.server import FreeCADConnection
+
+
+class _StubProxy:
+    """Stands in for the XML-RPC proxy, answering every call with an empty result"""
+
+    def __getattr__(self, name):
+        return lambda *args: {}
+
+
+def test_revision_tracks_modifying_calls_only():
+    """Every call that can change a document bumps the shared revision; reads do not"""
+    connection = FreeCADConnection()
+    connection.server = _StubProxy()
+
+    start = FreeCADConnection.revision
+    connection.get_objects("Doc")
+    connection.get_object("Doc", "Box")
+    connection.get_parts_list()
+    connection.export_step("Doc", "/tmp/doc.step")
+    assert FreeCADConnection.revision == start
+
+    modifying_calls = [
+        lambda: connection.create_document("Doc"),
+        lambda: connection.create_parametric_model("Doc", "box", {}),
+        lambda: connection.create_object("Doc", {"Name": "Box", "Type": "Part::Box"}),
+        lambda: connection.edit_object("Doc", "Box", {}),
+        lambda: connection.delete_object("Doc", "Box"),
+        lambda: connection.insert_part_from_library("parts/bolt.FCStd"),
+        lambda: connection.execute_code("pass"),
+        lambda: connection.import_step_file("Doc", "/tmp/doc.step"),
+        lambda: connection.run_cnc_manufacturing_dfm_check("Doc", {}),
+        lambda: connection.run_3d_printing_dfm_check("Doc", {}),
+        lambda: connection.run_injection_molding_dfm_check("Doc", {}),
+        lambda: connection.restore_colors_after_check("Doc"),
+    ]
+    for expected, call in enumerate(modifying_calls, start + 1):
+        call()
+        assert FreeCADConnection.revision == expected
+
+    # Rejected before reaching FreeCAD, so nothing changed
+    connection.create_object("Doc", {"Name": "Box"})
+    assert FreeCADConnection.revision == start + len(modifying_calls)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the manufacturing framework tolerance tables
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from freecad_mcp.manufacturing_framework import ToleranceCalculator
+
+
+def test_iso_size_step_uses_inclusive_upper_bounds():
+    """Sizes on a step boundary belong to the lower step"""
+    assert [ToleranceCalculator.iso_size_step(size) for size in (0.5, 3, 3.01, 6, 25, 30, 30.5, 500)] == \
+        [0, 0, 1, 1, 4, 4, 5, 12]
+    assert ToleranceCalculator.iso_size_step(900) == 12
+
+
+@pytest.mark.parametrize("grade, size, limits_um", [
+    ("H7", 25, (21, 0)),
+    ("H8", 25, (33, 0)),
+    ("h6", 25, (0, -13)),
+    ("g6", 25, (-7, -20)),
+    ("f7", 25, (-20, -41)),
+    ("k6", 25, (15, 2)),
+    ("m6", 25, (21, 8)),
+    ("n6", 25, (28, 15)),
+    ("p6", 25, (35, 22)),
+    ("js6", 25, (6.5, -6.5)),
+    ("k8", 25, (33, 0)),
+    ("F8", 25, (53, 20)),
+    ("G7", 25, (28, 7)),
+    ("K7", 25, (6, -15)),
+    ("M7", 25, (0, -21)),
+    ("N7", 25, (-7, -28)),
+    ("P7", 25, (-14, -35)),
+    ("N9", 25, (0, -52)),
+    ("P8", 25, (-22, -55)),
+    ("N7", 2, (-4, -14)),
+    ("H11", 400, (360, 0)),
+    ("d9", 100, (-120, -207)),
+])
+def test_fit_deviations_follow_iso_286(grade, size, limits_um):
+    """Upper and lower deviations from the ISO 286 limit tables"""
+    upper, lower = ToleranceCalculator.fit_deviations(grade, ToleranceCalculator.iso_size_step(size))
+    assert (upper * 1000, lower * 1000) == pytest.approx(limits_um)
+
+
+@pytest.mark.parametrize("grade", ["X", "7", "H3", "H12", "", "Js6", "z6", "K9", "K4"])
+def test_fit_deviations_reject_unsupported_grades(grade):
+    with pytest.raises(ValueError):
+        ToleranceCalculator.fit_deviations(grade, 1)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the enhanced spatial framework
+"""
+
+import sys
+import os
+import random
+
+import pytest
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from freecad_mcp.enhanced_spatial_framework import (
+    ConstraintType, EnhancedSpatialFramework, SpatialConstraint, create_accessibility_constraint,
+    create_clearance_constraint, create_electronic_component, create_mechanical_component
+)
+
+
+def _random_layout(seed, count=60):
+    """Framework with boxes on a coarse grid, so touching and nested boxes are common"""
+    rng = random.Random(seed)
+    framework = EnhancedSpatialFramework()
+    for i in range(count):
+        position = tuple(rng.randrange(0, 200, 10) for _ in range(3))
+        dimensions = tuple(rng.randrange(10, 60, 10) for _ in range(3))
+        framework.add_object(create_mechanical_component(f"part{i}", position, dimensions))
+    return framework
+
+
+def _pairwise_collisions(framework):
+    """Colliding name pairs from the full pairwise scan the broad phase replaced"""
+    names = list(framework.objects)
+    boxes = [framework.objects[name].bounding_box for name in names]
+    return [(names[i], names[j])
+            for i in range(len(boxes))
+            for j in range(i + 1, len(boxes))
+            if boxes[i].intersects(boxes[j])]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_detect_collisions_matches_pairwise_scan(seed):
+    """Sweep and prune reports the same collisions, in the same order"""
+    framework = _random_layout(seed)
+    expected = _pairwise_collisions(framework)
+    assert expected
+    assert [(c["object1"], c["object2"]) for c in framework.detect_collisions()] == expected
+
+    boxes = [obj.bounding_box for obj in framework.objects.values()]
+    pairs = framework._broadphase_pairs(boxes)
+    assert pairs == sorted(pairs)
+    assert all(boxes[i].intersects(boxes[j]) for i, j in pairs)
+
+
+def test_touching_boxes_collide():
+    """Boxes sharing a face count as colliding, as BoundingBox.intersects defines"""
+    framework = EnhancedSpatialFramework()
+    framework.add_object(create_mechanical_component("a", (0, 0, 0), (10, 10, 10)))
+    framework.add_object(create_mechanical_component("b", (10, 0, 0), (10, 10, 10)))
+    framework.add_object(create_mechanical_component("c", (30, 0, 0), (10, 10, 10)))
+    assert [(c["object1"], c["object2"]) for c in framework.detect_collisions()] == [("a", "b")]
+
+
+def _constraints(names):
+    """One constraint of every type over the given objects"""
+    first, second = names[0], names[1]
+    return [
+        create_clearance_constraint(first, second, 25.0),
+        create_clearance_constraint(first, second, 0.0),
+        SpatialConstraint(ConstraintType.CLEARANCE, [first], {}),
+        create_accessibility_constraint(first, "top", 40.0),
+        create_accessibility_constraint(second, "front", 80.0),
+        SpatialConstraint(ConstraintType.THERMAL, [first, second], {"max_temp_rise": 0.01}),
+        SpatialConstraint(ConstraintType.THERMAL, [first], {}),
+        SpatialConstraint(ConstraintType.GRAVITY, [first], {"min_support_area": 1000.0}),
+        SpatialConstraint(ConstraintType.ERGONOMIC, [second], {"optimal_height": (0, 10)}),
+        SpatialConstraint(ConstraintType.ELECTROMAGNETIC, [first, second], {})
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_violation_matches_evaluate(seed):
+    """violation() equals evaluate()["violation"] for every constraint type"""
+    framework = _random_layout(seed, count=20)
+    framework.add_object(create_electronic_component("board", (50, 50, 50), (30, 20, 5), 50.0))
+    names = list(framework.objects)
+    rng = random.Random(seed)
+
+    for _ in range(10):
+        for constraint in _constraints([names[-1]] + rng.sample(names[:-1], 2)):
+            assert constraint.violation(framework.objects) == constraint.evaluate(framework.objects)["violation"]